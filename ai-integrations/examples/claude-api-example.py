@@ -4,10 +4,16 @@ Example: Using Zeal MCP Server with Claude API
 This demonstrates tool extraction and execution with Claude
 """
 
-import json
-import requests
+import asyncio
+import hashlib
+from importlib.util import find_spec
+from collections import defaultdict
+import diskcache
+import httpx
+import orjson
 from anthropic import Anthropic
-from typing import List, Dict, Any
+from anthropic.types import Message
+from typing import List, Dict, Any, Optional, Tuple, Union
 
 # Configuration
 ZEAL_MCP_URL = "http://localhost:3457"
@@ -15,84 +21,184 @@ ZEAL_API_KEY = "your-zeal-api-key"  # Replace with your actual key
 
 client = Anthropic()  # Assumes ANTHROPIC_API_KEY is set in environment
 
-def fetch_mcp_tools() -> List[Dict[str, Any]]:
-    """Fetch available tools from Zeal MCP server"""
-    response = requests.get(
-        f"{ZEAL_MCP_URL}/tools",
-        headers={"X-API-Key": ZEAL_API_KEY}
+# Shared async HTTP client so MCP calls multiplex over one pooled connection
+# (HTTP/2 needs the `httpx[http2]` extra; without it plain HTTP/1.1 is used)
+_HTTP = httpx.AsyncClient(
+    http2=find_spec("h2") is not None,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=30.0,
+    headers={"X-API-Key": ZEAL_API_KEY, "Content-Type": "application/json"}
+)
+
+# On-disk cache of model responses so repeated runs skip identical LLM calls
+_LLM_CACHE = diskcache.Cache(".llm_cache")
+_LLM_CACHE_TTL = 24 * 60 * 60  # seconds
+
+def _normalize_prompt(text: str) -> str:
+    """Collapse whitespace so cosmetic prompt edits still hit the cache"""
+    return " ".join(text.split())
+
+def _jsonable(obj: Any) -> Any:
+    """Serialize SDK objects (e.g. content blocks) when building cache keys"""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def cached_chat(
+    model: str,
+    system: Optional[Union[str, List[Dict[str, Any]]]],
+    messages: List[Dict[str, Any]],
+    tools: Optional[List[Dict[str, Any]]] = None,
+    **kwargs: Any
+) -> Message:
+    """Call client.messages.create, reusing a cached response for identical requests"""
+    key_messages = [
+        {**m, "content": _normalize_prompt(m["content"])} if isinstance(m["content"], str) else m
+        for m in messages
+    ]
+    key_source = orjson.dumps(
+        {
+            "model": model,
+            "system": _normalize_prompt(system) if isinstance(system, str) else system,
+            "messages": key_messages,
+            "tools": tools,
+            **kwargs
+        },
+        option=orjson.OPT_SORT_KEYS,
+        default=_jsonable
     )
+    key = hashlib.sha256(key_source).hexdigest()
+    
+    cached = _LLM_CACHE.get(key)
+    if cached is not None:
+        return Message.model_validate(cached)
+    
+    request: Dict[str, Any] = {"model": model, "messages": messages, **kwargs}
+    if system:
+        request["system"] = system
+    if tools is not None:
+        request["tools"] = tools
+    
+    response = client.messages.create(**request)
+    _LLM_CACHE.set(key, response.model_dump(), expire=_LLM_CACHE_TTL)
+    return response
+
+# ETags of the last tools/resources responses, used to memoize the system prompt
+_ETAGS: Dict[str, Optional[str]] = {}
+_SYSTEM_PROMPTS: Dict[Tuple[str, str], str] = {}
+
+async def fetch_mcp_tools() -> List[Dict[str, Any]]:
+    """Fetch available tools from Zeal MCP server"""
+    response = await _HTTP.get(f"{ZEAL_MCP_URL}/tools")
     response.raise_for_status()
-    return response.json()
+    _ETAGS["tools"] = response.headers.get("ETag")
+    return orjson.loads(response.content)
 
-def execute_mcp_tool(name: str, arguments: Dict[str, Any]) -> Any:
+async def execute_mcp_tool(name: str, arguments: Dict[str, Any]) -> Any:
     """Execute a Zeal MCP tool via the server"""
-    response = requests.post(
+    response = await _HTTP.post(
         f"{ZEAL_MCP_URL}/tools/{name}/execute",
-        json=arguments,
-        headers={"X-API-Key": ZEAL_API_KEY}
+        content=orjson.dumps(arguments)
     )
     response.raise_for_status()
-    return response.json()["result"]
+    return orjson.loads(response.content)["result"]
 
-def fetch_mcp_resources() -> List[Dict[str, Any]]:
+async def fetch_mcp_resources() -> List[Dict[str, Any]]:
     """Fetch available resources for context"""
-    response = requests.get(
-        f"{ZEAL_MCP_URL}/resources",
-        headers={"X-API-Key": ZEAL_API_KEY}
-    )
+    response = await _HTTP.get(f"{ZEAL_MCP_URL}/resources")
     response.raise_for_status()
-    return response.json()
+    _ETAGS["resources"] = response.headers.get("ETag")
+    return orjson.loads(response.content)
 
-def get_prompt(name: str, args: Dict[str, Any]) -> str:
+async def get_prompt(name: str, args: Dict[str, Any]) -> str:
     """Get a generated prompt from MCP server"""
-    response = requests.get(
+    response = await _HTTP.get(
         f"{ZEAL_MCP_URL}/prompts/{name}",
-        params=args,
-        headers={"X-API-Key": ZEAL_API_KEY}
+        params=args
     )
     response.raise_for_status()
-    return response.json()["prompt"]
+    return orjson.loads(response.content)["prompt"]
 
-def main():
-    # 1. Fetch available tools from Zeal MCP
-    print("Fetching Zeal MCP tools...")
-    tools = fetch_mcp_tools()
-    print(f"Found {len(tools)} tools available\n")
+def build_system_prompt(tools: List[Dict[str, Any]], resources: List[Dict[str, Any]]) -> str:
+    """Serialize tools/resources into the system prompt once per server ETag"""
+    tools_etag, resources_etag = _ETAGS.get("tools"), _ETAGS.get("resources")
+    cache_key = (tools_etag, resources_etag) if tools_etag and resources_etag else None
+    if cache_key in _SYSTEM_PROMPTS:
+        return _SYSTEM_PROMPTS[cache_key]
     
-    # 2. Fetch resources for context
-    print("Fetching MCP resources...")
-    resources = fetch_mcp_resources()
     context = "\n".join([
-        f"Resource: {r['name']}\n{r['description']}\nContent: {json.dumps(r['content'], indent=2)}"
+        f"Resource: {r['name']}\n{r['description']}\nContent: {orjson.dumps(r['content'], option=orjson.OPT_INDENT_2).decode()}"
         for r in resources[:2]  # Limit to first 2 resources for brevity
     ])
+    tools_summary = orjson.dumps(
+        [{"name": t["name"], "description": t["description"]} for t in tools],
+        option=orjson.OPT_INDENT_2
+    ).decode()
     
-    # 3. Create a conversation with Claude using MCP tools
     system_prompt = f"""You are a workflow automation assistant with access to the Zeal platform.
     
 Available context from Zeal:
 {context}
 
 You have access to the following tools for workflow management:
-{json.dumps([{"name": t["name"], "description": t["description"]} for t in tools], indent=2)}
+{tools_summary}
 
 Use these tools to help users create, optimize, and manage workflows."""
+    
+    if cache_key:
+        _SYSTEM_PROMPTS[cache_key] = system_prompt
+    return system_prompt
+
+# Tool kinds matched against tool names when the server provides no category
+_TOOL_KINDS = ("debug", "workflow")
+
+def index_tools_by_kind(tools: List[Dict[str, Any]]) -> Dict[str, Tuple[Dict[str, Any], ...]]:
+    """Group the tool catalog once so each call reuses the same (cache-stable) subset"""
+    tools_by_kind: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for tool in tools:
+        kinds = {kind for kind in _TOOL_KINDS if kind in tool["name"]}
+        if tool.get("category"):
+            kinds.add(tool["category"])
+        for kind in kinds:
+            tools_by_kind[kind].append(tool)
+    return defaultdict(tuple, {kind: tuple(group) for kind, group in tools_by_kind.items()})
+
+async def main():
+    # 1. Fetch available tools and resources from Zeal MCP concurrently
+    print("Fetching Zeal MCP tools and resources...")
+    tools, resources = await asyncio.gather(fetch_mcp_tools(), fetch_mcp_resources())
+    print(f"Found {len(tools)} tools available\n")
+    
+    # 2. Build the system prompt (context + tool summary) once for all Claude calls
+    system_prompt = build_system_prompt(tools, resources)
+    tools_by_kind = index_tools_by_kind(tools)
 
     # Example 1: Create and optimize a workflow
     print("\n" + "="*50)
     print("Example 1: Creating and optimizing a workflow")
     print("="*50)
     
-    response = client.messages.create(
-        model="claude-3-opus-20240229",
-        max_tokens=1000,
-        system=system_prompt,
-        messages=[
+    # Mark the static prefix (tools + system prompt + original request) for
+    # Anthropic prompt caching so the follow-up call only prefills the new turn
+    cached_system = [
+        {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+    ]
+    initial_request = {
+        "role": "user",
+        "content": [
             {
-                "role": "user",
-                "content": "Create a data processing workflow that handles CSV files, validates the data, transforms it, and stores it in a database. Make it efficient and reliable."
+                "type": "text",
+                "text": "Create a data processing workflow that handles CSV files, validates the data, transforms it, and stores it in a database. Make it efficient and reliable.",
+                "cache_control": {"type": "ephemeral"}
             }
-        ],
+        ]
+    }
+    
+    response = cached_chat(
+        model="claude-3-opus-20240229",
+        max_tokens=1000,
+        system=cached_system,
+        messages=[initial_request],
         tools=tools,
         tool_choice={"type": "auto"}
     )
@@ -105,32 +211,30 @@ Use these tools to help users create, optimize, and manage workflows."""
             print(f"Text: {content.text}")
         elif content.type == "tool_use":
             print(f"\nTool call: {content.name}")
-            print(f"Arguments: {json.dumps(content.input, indent=2)}")
+            print(f"Arguments: {orjson.dumps(content.input, option=orjson.OPT_INDENT_2).decode()}")
             
             # Execute the tool
             try:
-                result = execute_mcp_tool(content.name, content.input)
-                print(f"Result: {json.dumps(result, indent=2)}")
+                result = await execute_mcp_tool(content.name, content.input)
+                print(f"Result: {orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()}")
                 
                 # Continue conversation with tool result
-                follow_up = client.messages.create(
+                follow_up = cached_chat(
                     model="claude-3-opus-20240229",
                     max_tokens=1000,
-                    system=system_prompt,
+                    system=cached_system,
                     messages=[
-                        {
-                            "role": "user",
-                            "content": "Create a data processing workflow that handles CSV files, validates the data, transforms it, and stores it in a database. Make it efficient and reliable."
-                        },
+                        initial_request,
                         {
                             "role": "assistant",
                             "content": response.content
                         },
                         {
                             "role": "user",
-                            "content": f"Tool '{content.name}' returned: {json.dumps(result)}. Please continue with the workflow setup."
+                            "content": f"Tool '{content.name}' returned: {orjson.dumps(result).decode()}. Please continue with the workflow setup."
                         }
-                    ]
+                    ],
+                    tools=tools
                 )
                 
                 print(f"\nFollow-up response: {follow_up.content[0].text}")
@@ -143,16 +247,17 @@ Use these tools to help users create, optimize, and manage workflows."""
     print("Example 2: Using MCP prompts")
     print("="*50)
     
-    prompt = get_prompt("workflow_from_description", {
+    prompt = await get_prompt("workflow_from_description", {
         "description": "Monitor website for changes and send notifications",
         "complexity": "moderate"
     })
     
     print(f"Generated prompt:\n{prompt}")
     
-    response = client.messages.create(
+    response = cached_chat(
         model="claude-3-opus-20240229",
         max_tokens=1000,
+        system=None,
         messages=[
             {
                 "role": "user",
@@ -168,7 +273,13 @@ Use these tools to help users create, optimize, and manage workflows."""
     print("Example 3: AI-powered debugging")
     print("="*50)
     
-    debug_response = client.messages.create(
+    # tool_choice "any" is rejected when no tools are offered
+    debug_tools = tools_by_kind["debug"]
+    if not debug_tools:
+        print("No debugging tools available, skipping")
+        return
+    
+    debug_response = cached_chat(
         model="claude-3-opus-20240229",
         max_tokens=1000,
         system=system_prompt,
@@ -178,7 +289,7 @@ Use these tools to help users create, optimize, and manage workflows."""
                 "content": "My workflow execution failed with ID 'exec_123'. Can you help me debug it and suggest fixes?"
             }
         ],
-        tools=[t for t in tools if "debug" in t["name"]],
+        tools=debug_tools,
         tool_choice={"type": "any"}
     )
     
@@ -190,35 +301,41 @@ Use these tools to help users create, optimize, and manage workflows."""
             # In real scenario, would execute the debug tool
 
 # Example: Compare workflows
-def compare_workflows_example():
+async def compare_workflows_example():
     """Example of comparing two workflows"""
-    result = execute_mcp_tool("compare_workflows", {
+    result = await execute_mcp_tool("compare_workflows", {
         "workflow_a": "wf_001",
         "workflow_b": "wf_002",
         "comparison_aspects": ["structure", "performance", "reliability"]
     })
     
-    print(f"Comparison results: {json.dumps(result, indent=2)}")
+    print(f"Comparison results: {orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()}")
 
 # Example: Generate test data
-def generate_test_data_example():
+async def generate_test_data_example():
     """Example of generating test data for a workflow"""
-    result = execute_mcp_tool("generate_test_data", {
+    result = await execute_mcp_tool("generate_test_data", {
         "workflow_id": "wf_001",
         "test_scenarios": 10,
         "include_edge_cases": True
     })
     
-    print(f"Generated test data: {json.dumps(result, indent=2)}")
+    print(f"Generated test data: {orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()}")
+
+async def run():
+    try:
+        await main()
+        
+        # Uncomment to test additional examples
+        # print("\n" + "="*50)
+        # print("Testing workflow comparison...")
+        # await compare_workflows_example()
+        # 
+        # print("\n" + "="*50)
+        # print("Testing test data generation...")
+        # await generate_test_data_example()
+    finally:
+        await _HTTP.aclose()
 
 if __name__ == "__main__":
-    main()
-    
-    # Uncomment to test additional examples
-    # print("\n" + "="*50)
-    # print("Testing workflow comparison...")
-    # compare_workflows_example()
-    # 
-    # print("\n" + "="*50)
-    # print("Testing test data generation...")
-    # generate_test_data_example()
\ No newline at end of file
+    asyncio.run(run())
\ No newline at end of file
@@ -4,10 +4,15 @@ Example: Using Zeal OpenAI Functions with the OpenAI API
 This demonstrates tool extraction and execution with GPT models
 """
 
-import json
-import requests
+import asyncio
+import hashlib
+from importlib.util import find_spec
+import diskcache
+import httpx
+import orjson
 from openai import OpenAI
-from typing import List, Dict, Any
+from openai.types.chat import ChatCompletion
+from typing import AsyncIterator, List, Dict, Any, Optional
 
 # Configuration
 ZEAL_FUNCTIONS_URL = "http://localhost:3456"
@@ -15,29 +20,90 @@ ZEAL_API_KEY = "your-zeal-api-key"  # Replace with your actual key
 
 client = OpenAI()  # Assumes OPENAI_API_KEY is set in environment
 
-def fetch_zeal_functions() -> List[Dict[str, Any]]:
-    """Fetch available functions from Zeal OpenAI Functions server"""
-    response = requests.get(
-        f"{ZEAL_FUNCTIONS_URL}/tools",
-        headers={"X-API-Key": ZEAL_API_KEY}
+# Shared async HTTP client so function calls multiplex over one pooled connection
+# (HTTP/2 needs the `httpx[http2]` extra; without it plain HTTP/1.1 is used)
+_HTTP = httpx.AsyncClient(
+    http2=find_spec("h2") is not None,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=30.0,
+    headers={"X-API-Key": ZEAL_API_KEY, "Content-Type": "application/json"}
+)
+
+# On-disk cache of model responses so repeated runs skip identical LLM calls
+_LLM_CACHE = diskcache.Cache(".llm_cache")
+_LLM_CACHE_TTL = 24 * 60 * 60  # seconds
+
+def _normalize_prompt(text: str) -> str:
+    """Collapse whitespace so cosmetic prompt edits still hit the cache"""
+    return " ".join(text.split())
+
+def _jsonable(obj: Any) -> Any:
+    """Serialize SDK objects (e.g. assistant messages) when building cache keys"""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def cached_chat(
+    model: str,
+    messages: List[Any],
+    tools: Optional[List[Dict[str, Any]]] = None,
+    **kwargs: Any
+) -> ChatCompletion:
+    """Call client.chat.completions.create, reusing a cached response for identical requests"""
+    key_messages = [
+        {**m, "content": _normalize_prompt(m["content"])}
+        if isinstance(m, dict) and isinstance(m.get("content"), str) else m
+        for m in messages
+    ]
+    key_source = orjson.dumps(
+        {"model": model, "messages": key_messages, "tools": tools, **kwargs},
+        option=orjson.OPT_SORT_KEYS,
+        default=_jsonable
     )
+    key = hashlib.sha256(key_source).hexdigest()
+    
+    cached = _LLM_CACHE.get(key)
+    if cached is not None:
+        return ChatCompletion.model_validate(cached)
+    
+    request: Dict[str, Any] = {"model": model, "messages": messages, **kwargs}
+    if tools is not None:
+        request["tools"] = tools
+    
+    response = client.chat.completions.create(**request)
+    _LLM_CACHE.set(key, response.model_dump(), expire=_LLM_CACHE_TTL)
+    return response
+
+async def fetch_zeal_functions() -> List[Dict[str, Any]]:
+    """Fetch available functions from Zeal OpenAI Functions server"""
+    response = await _HTTP.get(f"{ZEAL_FUNCTIONS_URL}/tools")
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
 
-def execute_zeal_function(name: str, arguments: Dict[str, Any]) -> Any:
+async def execute_zeal_function(name: str, arguments: Dict[str, Any]) -> Any:
     """Execute a Zeal function via the server"""
-    response = requests.post(
+    response = await _HTTP.post(
         f"{ZEAL_FUNCTIONS_URL}/functions/execute",
-        json={"name": name, "arguments": arguments},
-        headers={"X-API-Key": ZEAL_API_KEY}
+        content=orjson.dumps({"name": name, "arguments": arguments})
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)["result"]
+
+async def execute_zeal_functions_batch(calls: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """Execute several Zeal functions in one round-trip (None if batching is unsupported)"""
+    response = await _HTTP.post(
+        f"{ZEAL_FUNCTIONS_URL}/functions/batch",
+        content=orjson.dumps({"calls": calls})
     )
+    if response.status_code == 404:
+        return None
     response.raise_for_status()
-    return response.json()["result"]
+    return orjson.loads(response.content)["results"]
 
-def main():
+async def main():
     # 1. Fetch available tools from Zeal
     print("Fetching Zeal functions...")
-    tools = fetch_zeal_functions()
+    tools = await fetch_zeal_functions()
     print(f"Found {len(tools)} functions available\n")
     
     # 2. Create a conversation with GPT using Zeal tools
@@ -53,7 +119,7 @@ def main():
     ]
     
     print("Sending request to GPT-4...")
-    response = client.chat.completions.create(
+    response = cached_chat(
         model="gpt-4-turbo-preview",
         messages=messages,
         tools=tools,
@@ -66,40 +132,52 @@ def main():
     if assistant_message.tool_calls:
         print(f"\nGPT wants to call {len(assistant_message.tool_calls)} functions:")
         
+        calls = [
+            {"name": tc.function.name, "arguments": orjson.loads(tc.function.arguments)}
+            for tc in assistant_message.tool_calls
+        ]
+        for call in calls:
+            print(f"\nExecuting: {call['name']}")
+            print(f"Arguments: {orjson.dumps(call['arguments'], option=orjson.OPT_INDENT_2).decode()}")
+        
+        # Execute all calls in a single round-trip via the Zeal batch endpoint
+        outcomes = await execute_zeal_functions_batch(calls)
+        if outcomes is None:
+            # Batch endpoint unavailable, run the independent calls concurrently
+            results = await asyncio.gather(
+                *[execute_zeal_function(call["name"], call["arguments"]) for call in calls],
+                return_exceptions=True
+            )
+            outcomes = [
+                {"status": "rejected", "error": str(result)}
+                if isinstance(result, Exception)
+                else {"status": "fulfilled", "result": result}
+                for result in results
+            ]
+        
         tool_results = []
-        for tool_call in assistant_message.tool_calls:
-            function_name = tool_call.function.name
-            function_args = json.loads(tool_call.function.arguments)
-            
-            print(f"\nExecuting: {function_name}")
-            print(f"Arguments: {json.dumps(function_args, indent=2)}")
+        for tool_call, call, outcome in zip(assistant_message.tool_calls, calls, outcomes):
+            if outcome["status"] == "fulfilled":
+                result = outcome.get("result")
+                print(f"\n{call['name']} result: {orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()}")
+                content = orjson.dumps(result).decode()
+            else:
+                print(f"\n{call['name']} error: {outcome.get('error')}")
+                content = orjson.dumps({"error": outcome.get("error")}).decode()
             
-            try:
-                # Execute the function via Zeal server
-                result = execute_zeal_function(function_name, function_args)
-                print(f"Result: {json.dumps(result, indent=2)}")
-                
-                tool_results.append({
-                    "tool_call_id": tool_call.id,
-                    "role": "tool",
-                    "name": function_name,
-                    "content": json.dumps(result)
-                })
-            except Exception as e:
-                print(f"Error: {e}")
-                tool_results.append({
-                    "tool_call_id": tool_call.id,
-                    "role": "tool",
-                    "name": function_name,
-                    "content": json.dumps({"error": str(e)})
-                })
+            tool_results.append({
+                "tool_call_id": tool_call.id,
+                "role": "tool",
+                "name": call["name"],
+                "content": content
+            })
         
         # 4. Send results back to GPT for final response
         messages.append(assistant_message)
         messages.extend(tool_results)
         
         print("\nGetting final response from GPT...")
-        final_response = client.chat.completions.create(
+        final_response = cached_chat(
             model="gpt-4-turbo-preview",
             messages=messages
         )
@@ -111,22 +189,20 @@ def main():
         print(assistant_message.content)
 
 # Example: Streaming execution events
-def stream_execution_events(execution_id: str):
-    """Stream real-time execution events"""
-    response = requests.get(
+async def stream_execution_events(execution_id: str) -> AsyncIterator[Dict[str, Any]]:
+    """Stream real-time execution events as they arrive"""
+    async with _HTTP.stream(
+        "GET",
         f"{ZEAL_FUNCTIONS_URL}/functions/stream/{execution_id}",
-        headers={"X-API-Key": ZEAL_API_KEY},
-        stream=True
-    )
-    
-    for line in response.iter_lines():
-        if line:
-            if line.startswith(b'data: '):
-                event_data = json.loads(line[6:])
-                print(f"Event: {event_data}")
+        timeout=None
+    ) as response:
+        async for line in response.aiter_lines():
+            # Blank keep-alive lines and other SSE fields fail the prefix check
+            if line.startswith("data: "):
+                yield orjson.loads(line[6:])
 
 # Example: Batch execution
-def batch_execute_example():
+async def batch_execute_example():
     """Execute multiple functions in batch"""
     batch_calls = [
         {
@@ -145,19 +221,28 @@ def batch_execute_example():
         }
     ]
     
-    response = requests.post(
+    response = await _HTTP.post(
         f"{ZEAL_FUNCTIONS_URL}/functions/batch",
-        json={"calls": batch_calls},
-        headers={"X-API-Key": ZEAL_API_KEY}
+        content=orjson.dumps({"calls": batch_calls})
     )
     
-    results = response.json()
-    print(f"Batch execution results: {json.dumps(results, indent=2)}")
+    results = orjson.loads(response.content)
+    print(f"Batch execution results: {orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()}")
+
+async def run():
+    try:
+        await main()
+        
+        # Uncomment to test batch execution
+        # print("\n" + "="*50)
+        # print("Testing batch execution...")
+        # await batch_execute_example()
+        
+        # Uncomment to stream events for an execution
+        # async for event in stream_execution_events("exec_123"):
+        #     print(f"Event: {event}")
+    finally:
+        await _HTTP.aclose()
 
 if __name__ == "__main__":
-    main()
-    
-    # Uncomment to test batch execution
-    # print("\n" + "="*50)
-    # print("Testing batch execution...")
-    # batch_execute_example()
\ No newline at end of file
+    asyncio.run(run())
\ No newline at end of file
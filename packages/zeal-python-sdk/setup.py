@@ -1,60 +0,0 @@
-from setuptools import setup, find_packages
-
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
-
-setup(
-    name="zeal-sdk",
-    version="1.0.0",
-    author="Zeal Team",
-    author_email="team@zeal.ai",
-    description="Python SDK for the Zeal Integration Protocol (ZIP)",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/offbit-ai/zeal",
-    project_urls={
-        "Bug Tracker": "https://github.com/offbit-ai/zeal/issues",
-        "Documentation": "https://docs.zeal.ai",
-    },
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "License :: OSI Approved :: Apache Software License",
-        "Operating System :: OS Independent",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-        "Topic :: Software Development :: Libraries :: Python Modules",
-        "Topic :: Internet :: WWW/HTTP :: Dynamic Content",
-        "Topic :: Scientific/Engineering :: Artificial Intelligence",
-    ],
-    packages=find_packages(),
-    python_requires=">=3.8",
-    install_requires=[
-        "httpx>=0.24.0",
-        "pydantic>=2.0.0",
-        "websockets>=11.0.0",
-        "aiohttp>=3.8.0",
-        "typing-extensions>=4.0.0",
-    ],
-    extras_require={
-        "dev": [
-            "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
-            "pytest-cov>=4.0.0",
-            "black>=23.0.0",
-            "isort>=5.0.0",
-            "mypy>=1.0.0",
-        ],
-        "test": [
-            "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
-            "pytest-mock>=3.10.0",
-            "httpx[test]>=0.24.0",
-        ],
-    },
-    keywords="workflow automation integration protocol api sdk",
-)
\ No newline at end of file
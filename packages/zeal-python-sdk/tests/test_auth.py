@@ -0,0 +1,69 @@
+"""Tests for auth token utilities."""
+
+import pytest
+
+from zeal.auth import (
+    TokenSubject,
+    generate_auth_token,
+    verify_and_parse_token,
+    parse_token_unsafe,
+    is_token_valid,
+)
+
+
+def test_token_round_trip():
+    """Test that a generated token verifies and parses back."""
+    token = generate_auth_token(
+        TokenSubject(id="user-1", type="user", tenant_id="tenant-1", roles=["admin"]),
+        {"secret_key": "test-secret", "expires_in": 60}
+    )
+    
+    payload = verify_and_parse_token(token, "test-secret")
+    assert payload["sub"] == "user-1"
+    assert payload["type"] == "user"
+    assert payload["tenant_id"] == "tenant-1"
+    assert payload["roles"] == ["admin"]
+    assert payload["exp"] == payload["iat"] + 60
+    assert parse_token_unsafe(token) == payload
+    assert is_token_valid(token, "test-secret") is True
+
+
+def test_subject_claims():
+    """Test that only set subject fields become claims, in payload order."""
+    subject = TokenSubject(id="user-1", roles=["admin"], type="user", teams=[])
+    
+    assert subject.to_claims() == {"type": "user", "roles": ["admin"]}
+    assert list(subject.to_claims()) == ["type", "roles"]
+
+
+def test_simple_subject_payload():
+    """Test the hand-serialized payload for subjects without extra claims."""
+    token = generate_auth_token(
+        {"id": 'svc "quoted"', "type": "service", "tenant_id": "tenant-1"},
+        {"secret_key": "test-secret", "expires_in": 30}
+    )
+    
+    payload = verify_and_parse_token(token, "test-secret")
+    assert list(payload) == [
+        "sub", "iat", "sdk_version", "application_id", "session_id",
+        "type", "tenant_id", "exp"
+    ]
+    assert payload["sub"] == 'svc "quoted"'
+    assert payload["application_id"] == "zeal-python-sdk"
+
+
+def test_token_signature_mismatch():
+    """Test that tokens signed with another key are rejected."""
+    token = generate_auth_token({"id": "svc-1"}, {"secret_key": "key-a"})
+    
+    with pytest.raises(ValueError, match="Invalid token signature"):
+        verify_and_parse_token(token, "key-b")
+    assert is_token_valid(token, "key-b") is False
+
+
+def test_token_requires_secret_key(monkeypatch):
+    """Test that a secret key is required for signing."""
+    monkeypatch.delenv("ZEAL_SECRET_KEY", raising=False)
+    
+    with pytest.raises(ValueError, match="ZEAL_SECRET_KEY is required"):
+        generate_auth_token({"id": "user-1"})
@@ -1,14 +1,21 @@
 """Test Zeal client functionality."""
 
+import asyncio
+import gzip
+import json
+
+import httpx
 import pytest
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 from zeal import ZealClient, ClientConfig
-from zeal.types import CreateWorkflowRequest, Position, AddNodeRequest, NodePort
+from zeal.types import CreateWorkflowRequest, Position, AddNodeRequest, NodePort, RemoveGroupRequest
 from zeal.events import (
     create_node_added_event, create_group_created_event,
     is_execution_event, is_workflow_event, is_crdt_event,
-    is_control_event, is_node_event, is_group_event
+    is_control_event, is_node_event, is_group_event,
+    parse_zip_webhook_event,
+    EventCategory, classify_event
 )
 
 
@@ -23,6 +30,17 @@ def test_client_config():
     assert config.default_timeout == timedelta(seconds=60)
     assert config.verify_tls is True
     assert config.user_agent == "zeal-python-sdk/1.0.0"
+    assert config.max_connections == 64
+    assert config.max_keepalive_connections == 32
+
+
+def test_client_config_from_dict():
+    """Test building a client configuration from a plain dict."""
+    config = ClientConfig.from_dict({"base_url": "http://zeal:3000", "max_retries": 5, "unknown": 1})
+    
+    assert config.base_url == "http://zeal:3000"
+    assert config.max_retries == 5
+    assert config.default_timeout == timedelta(seconds=30)
 
 
 def test_client_creation():
@@ -37,6 +55,308 @@ def test_client_creation():
     assert client.webhooks is not None
 
 
+def test_large_request_body_is_compressed():
+    """Test that bodies above the threshold are sent compressed when enabled."""
+    client = ZealClient(ClientConfig(base_url="http://localhost:3000", compress_requests=True))
+    payload = {"nodes": ["x" * 64] * 32}
+    
+    content, headers = client._encode_body(json.dumps(payload).encode())
+    assert headers["Content-Encoding"] in ("gzip", "zstd")
+    if headers["Content-Encoding"] == "gzip":
+        assert json.loads(gzip.decompress(content)) == payload
+    
+    assert client._encode_body(b'{"small":true}') == (b'{"small":true}', None)
+    assert client._encode_body(None) == (None, None)
+    
+    uncompressed = ZealClient(ClientConfig())
+    content, headers = uncompressed._encode_body(json.dumps(payload).encode())
+    assert headers is None
+    assert json.loads(content) == payload
+
+
+@pytest.mark.asyncio
+async def test_health_parses_response_body():
+    """Test that health() validates the JSON body straight into the model."""
+    def handler(request):
+        assert request.url.path == "/api/zip/health"
+        return httpx.Response(
+            200, content=b'{"status":"healthy","version":"1.0.0","services":{"api":"up"}}'
+        )
+    
+    client = ZealClient(ClientConfig(base_url="http://localhost:3000/"))
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    health = await client.health()
+    assert health.status == "healthy"
+    assert health.services == {"api": "up"}
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried():
+    """Test a 4xx response is raised without retrying."""
+    calls = []
+    
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(404)
+    
+    client = ZealClient(ClientConfig(base_url="http://localhost:3000", retry_backoff_ms=1))
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    with pytest.raises(httpx.HTTPStatusError):
+        await client._make_request("GET", "/api/zip/missing")
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_backoff_is_jittered_and_capped(monkeypatch):
+    """Test each retry draws its own jitter and never sleeps past the cap."""
+    from zeal import client as client_module
+    
+    delays = []
+    
+    async def fake_sleep(delay):
+        delays.append(delay)
+    
+    monkeypatch.setattr(client_module.asyncio, "sleep", fake_sleep)
+    
+    client = ZealClient(ClientConfig(base_url="http://localhost:3000", retry_backoff_ms=20000))
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(503)))
+    
+    with pytest.raises(httpx.HTTPStatusError):
+        await client._make_request("GET", "/api/zip/health")
+    
+    assert len(delays) == 3
+    assert 20.0 <= delays[0] <= client_module.MAX_RETRY_BACKOFF_S
+    assert delays[1:] == [client_module.MAX_RETRY_BACKOFF_S] * 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("has_bulk_endpoint", [True, False])
+async def test_add_nodes_bulk(has_bulk_endpoint):
+    """Test bulk node creation and its per-node fallback."""
+    paths = []
+    
+    def handler(request):
+        paths.append(request.url.path)
+        body = json.loads(request.content)
+        if request.url.path.endswith("/bulk"):
+            if not has_bulk_endpoint:
+                # nodes/bulk matches nodes/[nodeId], which has no POST handler
+                return httpx.Response(405)
+            return httpx.Response(200, json={"results": [
+                {"nodeId": node["templateId"], "node": {}} for node in body["nodes"]
+            ]})
+        return httpx.Response(200, json={"nodeId": body["templateId"], "node": {}})
+    
+    client = ZealClient(ClientConfig(base_url="http://localhost:3000"))
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    requests = [
+        AddNodeRequest(workflow_id="wf-1", template_id=f"tpl-{i}", position=Position(x=i, y=0))
+        for i in range(3)
+    ]
+    results = await client.orchestrator.add_nodes_bulk(requests)
+    
+    assert [result.node_id for result in results] == ["tpl-0", "tpl-1", "tpl-2"]
+    assert len(paths) == (1 if has_bulk_endpoint else 4)
+
+
+@pytest.mark.asyncio
+async def test_webhook_create_request_body():
+    """Test request models are sent as aliased JSON without null fields."""
+    from zeal.types import CreateWebhookRequest
+    
+    bodies = []
+    
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"success": True, "subscription": {
+            "id": "webhook-1", "url": "http://localhost:3001/webhooks", "events": ["*"],
+            "maxRetries": 3, "retryInterval": 1000, "isActive": True,
+            "createdAt": "2023-01-01T00:00:00Z"
+        }})
+    
+    client = ZealClient(ClientConfig(base_url="http://localhost:3000"))
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    result = await client.webhooks.create(CreateWebhookRequest(
+        url="http://localhost:3001/webhooks", events=["*"], max_retries=3
+    ))
+    
+    assert bodies == [{"url": "http://localhost:3001/webhooks", "events": ["*"], "maxRetries": 3}]
+    assert result.subscription.id == "webhook-1"
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_batch():
+    """Test running orchestrator calls concurrently in a batch."""
+    in_flight = 0
+    max_in_flight = 0
+    
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        body = json.loads(request.content)
+        if request.url.path.endswith("/groups"):
+            return httpx.Response(200, json={"success": True, "message": f"removed {body['groupId']}"})
+        return httpx.Response(200, json={"nodeId": body["templateId"], "node": {}})
+    
+    client = ZealClient(ClientConfig(base_url="http://localhost:3000"))
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    async with client.orchestrator.batch() as batch:
+        tasks = [
+            batch.add_node(AddNodeRequest(
+                workflow_id="wf-1", template_id=f"tpl-{i}", position=Position(x=i, y=0)
+            ))
+            for i in range(3)
+        ]
+        removed = batch.remove_group(RemoveGroupRequest(workflow_id="wf-1", group_id="group-1"))
+    
+    assert [task.result().node_id for task in tasks] == ["tpl-0", "tpl-1", "tpl-2"]
+    assert removed.result().message == "removed group-1"
+    assert max_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_trace_events_are_batched():
+    """Test that traced node executions are coalesced into one request."""
+    submitted = []
+    
+    def handler(request):
+        body = json.loads(request.content)
+        if request.url.path.endswith("/events"):
+            submitted.append(len(body["events"]))
+            return httpx.Response(200, json={"success": True, "eventsProcessed": len(body["events"])})
+        return httpx.Response(200, json={"success": True, "sessionId": "session-1"})
+    
+    client = ZealClient(ClientConfig(base_url="http://localhost:3000"))
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    for i in range(3):
+        await client.traces.trace_node_execution("session-1", f"node-{i}", "output", {"value": i})
+    # Non-str keys in user data must not fail the whole batch
+    await client.traces.trace_node_execution("session-1", "node-3", "output", {3: "value"})
+    assert submitted == []
+    
+    await client.traces.flush()
+    assert submitted == [4]
+    
+    # Later events go out in a batch of their own
+    for i in range(20):
+        await client.traces.trace_node_execution("session-1", f"node-{i}", "output", {"value": i})
+    await client.traces.flush()
+    assert submitted == [4, 20]
+
+
+@pytest.mark.asyncio
+async def test_failed_trace_submissions_keep_events(caplog):
+    """Test buffered trace events survive failed submissions and are sent on close."""
+    submitted = []
+    available = False
+    
+    def handler(request):
+        if not available:
+            return httpx.Response(503)
+        events = json.loads(request.content)["events"]
+        submitted.extend(event["nodeId"] for event in events)
+        return httpx.Response(200, json={"success": True, "eventsProcessed": len(events)})
+    
+    client = ZealClient(ClientConfig(base_url="http://localhost:3000", max_retries=0))
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    # A failed background flush is reported and keeps the events
+    await client.traces.trace_node_execution("session-1", "node-0", "output", {"value": 0})
+    await client.traces._flush_task
+    assert "Failed to submit trace events for session session-1" in caplog.text
+    
+    # A failed explicit flush raises and keeps them too
+    await client.traces.trace_node_execution("session-1", "node-1", "output", {"value": 1})
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.traces.flush()
+    assert [json.loads(event)["nodeId"] for event in client.traces._pending["session-1"]] == ["node-0", "node-1"]
+    
+    # Closing the client sends whatever is still buffered, in order
+    available = True
+    async with client:
+        pass
+    assert submitted == ["node-0", "node-1"]
+    assert not client.traces._pending
+
+
+@pytest.mark.asyncio
+async def test_failing_trace_buffer_is_bounded(monkeypatch, caplog):
+    """Test a failing session stops flushing inline and keeps only the newest events."""
+    from zeal import traces as traces_module
+    
+    monkeypatch.setattr(traces_module, "TRACE_MAX_BATCH", 2)
+    monkeypatch.setattr(traces_module, "TRACE_MAX_BUFFERED_EVENTS", 4)
+    
+    attempts = []
+    
+    def handler(request):
+        attempts.append(request)
+        return httpx.Response(503)
+    
+    client = ZealClient(ClientConfig(base_url="http://localhost:3000", max_retries=0))
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    # The first full batch is flushed inline and fails
+    await client.traces.trace_node_execution("session-1", "node-0", "output", None)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.traces.trace_node_execution("session-1", "node-1", "output", None)
+    
+    # Later events only queue for the background flush
+    for i in range(2, 7):
+        await client.traces.trace_node_execution("session-1", f"node-{i}", "output", None)
+    client.traces._flush_task.cancel()
+    
+    assert len(attempts) == 1
+    assert [json.loads(event)["nodeId"] for event in client.traces._pending["session-1"]] == [
+        "node-4", "node-5", "node-6"
+    ]
+    assert "Dropped 2 buffered trace events for session session-1" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_traced_events_match_trace_event_encoding():
+    """Test buffered trace events are sent exactly as TraceEvent would encode them."""
+    from pydantic_core import to_json
+    from zeal.types import TraceData, TraceEvent
+    
+    client = ZealClient(ClientConfig(base_url="http://localhost:3000"))
+    await client.traces.trace_node_execution("session-1", "node-1", "output", {"value": 1}, duration_ms=5)
+    await client.traces.trace_node_execution("session-1", "node-2", "input", None)
+    buffered = [json.loads(event) for event in client.traces._pending.pop("session-1")]
+    
+    expected = [
+        TraceEvent(
+            timestamp=buffered[0]["timestamp"], node_id="node-1", event_type="output", duration=5,
+            data=TraceData(size=11, data_type="application/json", preview={"value": 1}, full_data={"value": 1})
+        ),
+        TraceEvent(
+            timestamp=buffered[1]["timestamp"], node_id="node-2", event_type="input",
+            data=TraceData(size=4, data_type="application/json")
+        ),
+    ]
+    assert json.loads(to_json(expected, by_alias=True, exclude_none=True)) == buffered
+    
+    # Non-str keys in user data are sized like json.dumps would key them
+    await client.traces.trace_node_execution("session-1", "node-3", "output", {1: "a"})
+    assert json.loads(client.traces._pending.pop("session-1")[0])["data"]["size"] == len('{"1":"a"}')
+    
+    # Data is captured when traced, not when the batch is sent
+    data = {"v": 1}
+    await client.traces.trace_node_execution("session-1", "node-4", "output", data)
+    data["v"] = 100
+    traced = json.loads(client.traces._pending.pop("session-1")[0])["data"]
+    assert traced == {"size": len('{"v":1}'), "dataType": "application/json", "preview": {"v": 1}, "fullData": {"v": 1}}
+
+
 def test_client_creation_no_base_url():
     """Test client creation with empty base URL should fail."""
     config = ClientConfig(base_url="")
@@ -68,6 +388,64 @@ def test_type_creation():
     assert node_req.position.y == 200
 
 
+def test_json_object_fields():
+    """Test free-form object fields skip copying decoded dicts but still type-check."""
+    from pydantic import ValidationError
+    
+    data = {"type": "processor", "config": {"retries": 3}}
+    event = parse_zip_webhook_event({
+        "type": "node.added", "id": "evt-1", "timestamp": "2023-01-01T00:00:00Z",
+        "workflowId": "wf-1", "nodeId": "node-1", "data": data
+    })
+    assert event.data is data
+    
+    with pytest.raises(ValidationError):
+        CreateWorkflowRequest(name="wf", metadata=["not", "an", "object"])
+    with pytest.raises(ValidationError):
+        CreateWorkflowRequest(name="wf", metadata={1: "a"})
+    
+    request = CreateWorkflowRequest.model_validate_json('{"name": "wf", "metadata": {"a": 1}}')
+    assert request.metadata == {"a": 1}
+
+
+def test_event_schemas_built_at_import():
+    """Test that event models with forward references are complete at import."""
+    from zeal import events
+    
+    for name in events.EVENT_TYPE_MAP.values():
+        assert name.__pydantic_complete__, name.__name__
+
+
+def test_encode_request():
+    """Test request encoding uses aliases, drops None fields and builds deferred schemas."""
+    from zeal.types import UpdateWebhookRequest, _encode
+    
+    request = UpdateWebhookRequest.model_construct(url="http://localhost:3001/webhooks", is_active=False)
+    assert json.loads(_encode(request)) == {"url": "http://localhost:3001/webhooks", "isActive": False}
+
+
+def test_decode_response():
+    """Test responses are decoded on success and raise for any other status."""
+    from zeal.types import HealthCheckResponse, _decode
+    
+    request = httpx.Request("GET", "http://localhost:3000/api/zip/health")
+    ok = httpx.Response(200, json={"status": "healthy", "version": "1.0.0", "services": {}}, request=request)
+    assert _decode(ok, HealthCheckResponse).status == "healthy"
+    
+    with pytest.raises(httpx.HTTPStatusError):
+        _decode(httpx.Response(302, request=request), HealthCheckResponse)
+
+
+def test_model_warmup():
+    """Test deferred API model schemas can be built ahead of first use."""
+    from zeal import types
+    
+    types.warmup()
+    for model in vars(types).values():
+        if isinstance(model, type) and issubclass(model, types._Model):
+            assert model.__pydantic_complete__, model.__name__
+
+
 def test_event_creation():
     """Test creating events."""
     # Test node added event
@@ -82,6 +460,7 @@ def test_event_creation():
     assert event.node_id == "node-456"
     assert event.data["type"] == "processor"
     assert event.id.startswith("evt_")
+    assert datetime.fromisoformat(event.timestamp).utcoffset() == timedelta(0)
     
     # Test group created event
     group_event = create_group_created_event(
@@ -94,9 +473,27 @@ def test_event_creation():
     assert group_event.data["title"] == "Processing Group"
 
 
-def test_event_type_guards():
-    """Test event type guard functions."""
-    test_cases = [
+def test_parse_webhook_event_json():
+    """Test parsing events straight from JSON bytes."""
+    event = create_node_added_event(
+        workflow_id="wf-123",
+        node_id="node-456",
+        data={"type": "processor"}
+    )
+    raw = event.model_dump_json(by_alias=True).encode()
+    
+    parsed = parse_zip_webhook_event(raw)
+    assert type(parsed) is type(event)
+    assert parse_zip_webhook_event(raw.decode()) == parsed
+    assert parsed == parse_zip_webhook_event(event.model_dump(by_alias=True))
+    
+    with pytest.raises(ValueError):
+        parse_zip_webhook_event(b'{"type": "unknown.event"}')
+
+
+@pytest.mark.parametrize(
+    "event_type,is_exec,is_wf,is_crdt,is_ctrl,is_node,is_grp",
+    [
         ("node.executing", True, False, False, False, True, False),
         ("execution.started", True, False, False, False, False, False),
         ("workflow.created", False, True, False, False, False, False),
@@ -105,21 +502,40 @@ def test_event_type_guards():
         ("connection.added", False, False, True, False, False, False),
         ("subscribe", False, False, False, True, False, False),
         ("ping", False, False, False, True, False, False),
-    ]
+        ("workflow.archived", False, False, False, False, False, False),
+    ],
+)
+def test_event_type_guards(event_type, is_exec, is_wf, is_crdt, is_ctrl, is_node, is_grp):
+    """Test event type guard functions."""
+    assert is_execution_event(event_type) == is_exec, f"is_execution_event({event_type})"
+    assert is_workflow_event(event_type) == is_wf, f"is_workflow_event({event_type})"
+    assert is_crdt_event(event_type) == is_crdt, f"is_crdt_event({event_type})"
+    assert is_control_event(event_type) == is_ctrl, f"is_control_event({event_type})"
+    assert is_node_event(event_type) == is_node, f"is_node_event({event_type})"
+    assert is_group_event(event_type) == is_grp, f"is_group_event({event_type})"
+    
+    # The classifier agrees with the individual guards
+    category = classify_event(event_type)
+    assert bool(category & EventCategory.EXECUTION) == is_exec
+    assert bool(category & EventCategory.WORKFLOW) == is_wf
+    assert bool(category & EventCategory.CRDT) == is_crdt
+    assert bool(category & EventCategory.CONTROL) == is_ctrl
+    assert bool(category & EventCategory.NODE) == is_node
+    assert bool(category & EventCategory.GROUP) == is_grp
+
+
+def test_list_workflows_params_query():
+    """Test that list params match their exclude_none dump."""
+    from zeal.types import ListWorkflowsParams
     
-    for event_type, is_exec, is_wf, is_crdt, is_ctrl, is_node, is_grp in test_cases:
-        assert is_execution_event(event_type) == is_exec, f"is_execution_event({event_type})"
-        assert is_workflow_event(event_type) == is_wf, f"is_workflow_event({event_type})"
-        assert is_crdt_event(event_type) == is_crdt, f"is_crdt_event({event_type})"
-        assert is_control_event(event_type) == is_ctrl, f"is_control_event({event_type})"
-        assert is_node_event(event_type) == is_node, f"is_node_event({event_type})"
-        assert is_group_event(event_type) == is_grp, f"is_group_event({event_type})"
+    for params in (ListWorkflowsParams(), ListWorkflowsParams(limit=10), ListWorkflowsParams(limit=5, offset=20)):
+        assert params.to_query() == params.model_dump(exclude_none=True)
 
 
 def test_position_serialization():
     """Test Position serialization."""
     pos = Position(x=100.5, y=200.7)
-    data = pos.dict()
+    data = pos.model_dump()
     
     assert data["x"] == 100.5
     assert data["y"] == 200.7
@@ -128,17 +544,22 @@ def test_position_serialization():
     pos2 = Position(**data)
     assert pos2.x == 100.5
     assert pos2.y == 200.7
+    
+    # Positions stay mutable
+    pos2.x = 1.0
+    assert pos2.x == 1.0
 
 
 def test_node_port_serialization():
     """Test NodePort serialization with aliases."""
     port = NodePort(node_id="node1", port_id="output")
-    data = port.dict(by_alias=True)
+    data = port.model_dump(by_alias=True)
     
     assert data["nodeId"] == "node1"
     assert data["portId"] == "output"
+    assert port.to_dict() == data
     
     # Test deserialization from API format
     port2 = NodePort(**{"nodeId": "node2", "portId": "input"})
     assert port2.node_id == "node2"
-    assert port2.port_id == "input"
\ No newline at end of file
+    assert port2.port_id == "input"
@@ -32,6 +32,16 @@ def zeal_client(client_config):
     return ZealClient(client_config)
 
 
+@pytest.fixture(scope="module")
+def signed_body():
+    """A webhook body and its raw HMAC-SHA256 digest under "test-secret"."""
+    import hmac
+    import hashlib
+    
+    body = b'{"test": "data"}'
+    return body, hmac.new(b"test-secret", body, hashlib.sha256).digest()
+
+
 @pytest.fixture
 def subscription_options():
     """Create test subscription options."""
@@ -58,7 +68,9 @@ def test_default_subscription_options():
     assert options.namespace == "default"
     assert options.events == ["*"]
     assert options.buffer_size == 1000
+    assert options.replay_size == 0
     assert options.verify_signature is False
+    assert options.max_concurrent_deliveries == 256
 
 
 def test_custom_subscription_options(subscription_options):
@@ -78,8 +90,14 @@ def test_webhook_observable():
     
     # Test initial state
     assert observable._buffer_size == 100
+    assert observable._buffer.maxlen == 0
     assert not observable._completed
     assert len(observable._subscribers) == 0
+    
+    # Replay is opt-in, and filtered observables never keep their own copy
+    replaying = WebhookObservable(replay_size=10)
+    assert replaying._buffer.maxlen == 10
+    assert replaying.filter(lambda event: True)._buffer.maxlen == 0
 
 
 def test_webhook_observable_subscription():
@@ -113,7 +131,7 @@ def test_webhook_observable_subscription():
 @pytest.mark.asyncio
 async def test_webhook_observable_emit():
     """Test WebhookObservable event emission."""
-    observable = WebhookObservable()
+    observable = WebhookObservable(replay_size=10)
     
     events_received = []
     
@@ -142,6 +160,49 @@ async def test_webhook_observable_emit():
     # Both handlers should have received the event
     assert len(events_received) == 2
     assert all(event.node_id == "test-node" for event in events_received)
+    
+    # Failures in async handlers are routed to their error handler
+    errors_received = []
+    
+    async def failing_handler(event):
+        raise RuntimeError("boom")
+    
+    observable.subscribe(failing_handler, errors_received.append)
+    await observable.emit(test_event)
+    
+    assert len(events_received) == 4
+    assert [str(err) for err in errors_received] == ["boom"]
+    assert observable.buffered_events() == [test_event, test_event]
+
+
+@pytest.mark.asyncio
+async def test_webhook_observable_queued_subscriber():
+    """Test that queued subscribers drop the oldest events when full."""
+    observable = WebhookObservable(buffer_size=2)
+    
+    events_received = []
+    completed = asyncio.Event()
+    
+    observable.subscribe_queued(events_received.append, complete_handler=completed.set)
+    subscriber = next(iter(observable._subscribers.values()))
+    
+    events = [
+        create_node_added_event(workflow_id="test-workflow", node_id=f"node-{i}", data={})
+        for i in range(3)
+    ]
+    for event in events:
+        await observable.emit(event)
+    
+    # Nothing is delivered until the consumer task runs
+    assert events_received == []
+    assert subscriber['dropped'] == 1
+    
+    observable.complete()
+    await asyncio.wait_for(completed.wait(), timeout=1)
+    
+    # The oldest event made room for the completion marker
+    assert subscriber['dropped'] == 2
+    assert events_received == events[2:]
 
 
 def test_webhook_observable_filter():
@@ -233,6 +294,28 @@ def test_webhook_subscription_event_type_filtering(zeal_client):
     assert len(subscription._event_callbacks) == 0
 
 
+def test_webhook_subscription_event_type_glob(zeal_client):
+    """Test WebhookSubscription event type filtering with glob patterns."""
+    subscription = WebhookSubscription(zeal_client.webhooks)
+    
+    received_events = []
+    subscription.on_event_type(["node.*", "workflow.created"], received_events.append)
+    filtered_callback, is_async = next(iter(subscription._event_callbacks.values()))
+    assert not is_async
+    
+    event = create_node_added_event(
+        workflow_id="test-workflow",
+        node_id="test-node",
+        data={"type": "processor"}
+    )
+    filtered_callback(event)
+    assert received_events == [event]
+    
+    event.type = "connection.added"
+    filtered_callback(event)
+    assert received_events == [event]
+
+
 def test_webhook_subscription_source_filtering(zeal_client):
     """Test WebhookSubscription source filtering."""
     subscription = WebhookSubscription(zeal_client.webhooks)
@@ -320,6 +403,21 @@ def test_webhook_delivery_parsing():
     assert len(delivery.events) == 1
     assert delivery.metadata.namespace == "test"
     assert delivery.metadata.delivery_id == "delivery-123"
+    
+    # The receiver's fast path builds an equivalent delivery
+    assert WebhookDelivery.from_wire(delivery_data) == delivery
+    
+    # ...but still rejects what the full validator would
+    invalid_deliveries = [
+        {"events": []},
+        {**delivery_data, "webhookId": 123},
+        {**delivery_data, "events": ['{"type": "node.added"}']},
+        {**delivery_data, "metadata": {**delivery_data["metadata"], "timestamp": None}},
+        {**delivery_data, "metadata": None},
+    ]
+    for invalid in invalid_deliveries:
+        with pytest.raises(ValueError):
+            WebhookDelivery.from_wire(invalid)
 
 
 def test_webhook_metadata_parsing():
@@ -338,7 +436,7 @@ def test_webhook_metadata_parsing():
 
 
 @pytest.mark.asyncio  
-async def test_webhook_subscription_signature_verification():
+async def test_webhook_subscription_signature_verification(signed_body):
     """Test webhook signature verification."""
     options = SubscriptionOptions(
         verify_signature=True,
@@ -350,19 +448,11 @@ async def test_webhook_subscription_signature_verification():
     subscription = WebhookSubscription(mock_webhooks_api, options)
     
     # Test signature verification method directly
-    body = b'{"test": "data"}'
-    
-    # Calculate expected signature
-    import hmac
-    import hashlib
-    expected_sig = hmac.new(
-        b"test-secret",
-        body,
-        hashlib.sha256
-    ).hexdigest()
+    body, digest = signed_body
+    assert subscription._verify_digest(body, digest) is True
     
     # Test valid signature
-    valid_signature = f"sha256={expected_sig}"
+    valid_signature = f"sha256={digest.hex()}"
     assert subscription._verify_signature(body, valid_signature) is True
     
     # Test invalid signature
@@ -372,6 +462,12 @@ async def test_webhook_subscription_signature_verification():
     # Test malformed signature
     malformed_signature = "invalid-format"
     assert subscription._verify_signature(body, malformed_signature) is False
+    
+    # Test batch verification
+    assert subscription.verify_many(
+        [body, body, body],
+        [valid_signature, invalid_signature, malformed_signature]
+    ) == [True, False, False]
 
 
 @pytest.mark.asyncio
@@ -422,4 +518,210 @@ async def test_process_delivery(zeal_client):
     event = events_received[0]
     assert event.type == "node.added"
     assert event.workflow_id == "workflow-456"
-    assert hasattr(event, 'node_id') and event.node_id == "node-789"
\ No newline at end of file
+    assert hasattr(event, 'node_id') and event.node_id == "node-789"
+
+
+@pytest.mark.asyncio
+async def test_process_delivery_async_callback_errors(zeal_client):
+    """Test async event callbacks run alongside sync ones and report failures."""
+    subscription = WebhookSubscription(zeal_client.webhooks)
+    
+    events_received = []
+    errors_received = []
+    
+    async def failing_callback(event):
+        raise RuntimeError("callback failed")
+    
+    subscription.on_event(events_received.append)
+    subscription.on_event(failing_callback)
+    subscription.on_error(errors_received.append)
+    
+    delivery = WebhookDelivery(
+        webhook_id="webhook-123",
+        events=[
+            {
+                "type": "node.added",
+                "id": "evt_123",
+                "timestamp": "2023-01-01T00:00:00Z",
+                "workflowId": "workflow-456",
+                "nodeId": "node-789",
+                "data": {}
+            }
+        ],
+        metadata=WebhookMetadata(
+            namespace="test",
+            delivery_id="delivery-123",
+            timestamp="2023-01-01T00:00:00Z"
+        )
+    )
+    await subscription._process_delivery(delivery)
+    
+    assert len(events_received) == 1
+    assert [str(err) for err in errors_received] == ["callback failed"]
+
+
+@pytest.mark.asyncio
+async def test_webhook_handler_tracks_deliveries(zeal_client):
+    """Test background deliveries are tracked and bounded."""
+    options = SubscriptionOptions(auto_register=False, max_concurrent_deliveries=1)
+    subscription = WebhookSubscription(zeal_client.webhooks, options)
+    
+    deliveries_received = []
+    subscription.on_delivery(deliveries_received.append)
+    
+    request = Mock()
+    request.headers = {}
+    request.content_length = None
+    request.read = AsyncMock(return_value=json.dumps({
+        "webhookId": "webhook-123",
+        "events": [],
+        "metadata": {
+            "namespace": "test",
+            "deliveryId": "delivery-123",
+            "timestamp": "2023-01-01T00:00:00Z"
+        }
+    }).encode())
+    
+    response = await subscription._webhook_handler(request)
+    assert response.status == 200
+    assert len(subscription._inflight) == 1
+    assert subscription._delivery_slots.locked()
+    
+    await asyncio.gather(*subscription._inflight)
+    await asyncio.sleep(0)
+    assert len(deliveries_received) == 1
+    assert not subscription._inflight
+    assert not subscription._delivery_slots.locked()
+
+
+@pytest.mark.asyncio
+async def test_process_delivery_without_event_listeners(zeal_client):
+    """Test events are not parsed when nothing would receive them."""
+    options = SubscriptionOptions(auto_register=False)
+    subscription = WebhookSubscription(zeal_client.webhooks, options)
+    assert not subscription.as_observable().is_observed()
+    assert WebhookObservable(replay_size=1).is_observed()
+    
+    deliveries_received = []
+    subscription.on_delivery(deliveries_received.append)
+    
+    delivery = WebhookDelivery(
+        webhook_id="webhook-123",
+        events=[{"type": "node.added", "id": "evt_123"}],
+        metadata=WebhookMetadata(namespace="test", delivery_id="delivery-123", timestamp="2023-01-01T00:00:00Z")
+    )
+    
+    with patch("zeal.subscription.parse_zip_webhook_event") as parse:
+        await subscription._process_delivery(delivery)
+        parse.assert_not_called()
+    
+    assert deliveries_received == [delivery]
+
+
+@pytest.mark.asyncio
+async def test_webhook_handler_streams_sized_body(zeal_client):
+    """Test bodies with a Content-Length are streamed into one buffer."""
+    import hmac
+    import hashlib
+    
+    options = SubscriptionOptions(auto_register=False, verify_signature=True, secret_key="test-secret")
+    subscription = WebhookSubscription(zeal_client.webhooks, options)
+    body = json.dumps({
+        "webhookId": "webhook-123",
+        "events": [{"type": "node.added", "workflowId": "workflow-456"}],
+        "metadata": {
+            "namespace": "test",
+            "deliveryId": "delivery-123",
+            "timestamp": "2023-01-01T00:00:00Z"
+        }
+    }).encode()
+    digest = hmac.new(b"test-secret", body, hashlib.sha256).digest()
+    
+    async def iter_chunked(size):
+        for start in range(0, len(body), 7):
+            yield body[start:start + 7]
+    
+    request = Mock()
+    request.headers = {"X-Zeal-Signature": f"sha256={digest.hex()}"}
+    request.content_length = len(body)
+    request.content.iter_chunked = iter_chunked
+    request.read = AsyncMock()
+    
+    with patch.object(subscription, "_process_delivery", AsyncMock()) as process:
+        response = await subscription._webhook_handler(request)
+        await asyncio.gather(*subscription._inflight)
+    
+    assert response.status == 200
+    request.read.assert_not_called()
+    process.assert_awaited_once()
+    assert process.await_args.args[0].webhook_id == "webhook-123"
+    
+    request.content_length = 17 * 1024 * 1024
+    response = await subscription._webhook_handler(request)
+    assert response.status == 413
+    
+    # Chunked bodies are cut off by aiohttp's client_max_size instead
+    from aiohttp import web
+    
+    request.content_length = None
+    request.read = AsyncMock(side_effect=web.HTTPRequestEntityTooLarge(max_size=16, actual_size=17))
+    response = await subscription._webhook_handler(request)
+    assert response.status == 413
+
+
+@pytest.mark.asyncio
+async def test_webhook_subscription_register_reuses_request():
+    """Test the registration request is built once and reused."""
+    mock_webhooks_api = Mock(spec=WebhooksAPI)
+    mock_webhooks_api.create = AsyncMock(return_value=Mock(subscription=Mock(id="webhook-123")))
+    subscription = WebhookSubscription(mock_webhooks_api, SubscriptionOptions(auto_register=False))
+    subscription._is_running = True
+    
+    await subscription.register()
+    await subscription.register()
+    
+    first, second = [call.args[0] for call in mock_webhooks_api.create.await_args_list]
+    assert first is second
+    assert first.url == "http://localhost:3001/webhooks"
+    assert subscription.webhook_id() == "webhook-123"
+
+
+@pytest.mark.asyncio
+async def test_webhook_handler_rejects_bad_signature(signed_body):
+    """Test the handler checks the signature while reading the body."""
+    options = SubscriptionOptions(auto_register=False, verify_signature=True, secret_key="test-secret")
+    subscription = WebhookSubscription(Mock(spec=WebhooksAPI), options)
+    body, digest = signed_body
+    
+    errors_received = []
+    subscription.on_error(errors_received.append)
+    
+    request = Mock()
+    request.headers = {"X-Zeal-Signature": f"sha256={bytes(32).hex()}"}
+    request.content_length = None
+    request.read = AsyncMock(return_value=body)
+    
+    response = await subscription._webhook_handler(request)
+    assert response.status == 401
+    assert [str(err) for err in errors_received] == ["Invalid webhook signature"]
+
+
+@pytest.mark.asyncio
+async def test_signal_handlers_leave_application_handlers(zeal_client):
+    """Test start/stop only touch the signal handlers the subscription installed."""
+    import signal
+    
+    loop = asyncio.get_running_loop()
+    app_handler = Mock()
+    loop.add_signal_handler(signal.SIGTERM, app_handler)
+    try:
+        subscription = WebhookSubscription(zeal_client.webhooks, SubscriptionOptions(auto_register=False))
+        subscription._setup_signal_handlers()
+        assert subscription._installed_signals == [signal.SIGINT]
+        
+        subscription._remove_signal_handlers()
+        assert not subscription._installed_signals
+        assert loop._signal_handlers[signal.SIGTERM]._callback is app_handler
+        assert signal.SIGINT not in loop._signal_handlers
+    finally:
+        loop.remove_signal_handler(signal.SIGTERM)
@@ -6,13 +6,16 @@ Generates auth tokens with the required information for zeal-auth
 import base64
 import hashlib
 import hmac
-import json
 import os
 import time
-import uuid
+from functools import lru_cache
+from operator import attrgetter
+from secrets import token_urlsafe
 from typing import Dict, Any, Optional, List, Union
 from dataclasses import dataclass, asdict
 
+import orjson
+
 
 @dataclass
 class TokenSubject:
@@ -26,6 +29,22 @@ class TokenSubject:
     roles: Optional[List[str]] = None
     permissions: Optional[List[str]] = None
     metadata: Optional[Dict[str, Any]] = None
+    
+    def to_claims(self) -> Dict[str, Any]:
+        """Token claims for the set subject fields other than id, in payload order"""
+        return {
+            name: value
+            for name, value in zip(_SUBJECT_CLAIMS, _subject_claim_values(self))
+            if value
+        }
+
+
+# Optional TokenSubject fields copied into the payload when set
+_SUBJECT_CLAIMS = (
+    "type", "tenant_id", "organization_id", "teams", "groups",
+    "roles", "permissions", "metadata",
+)
+_subject_claim_values = attrgetter(*_SUBJECT_CLAIMS)
 
 
 @dataclass
@@ -38,6 +57,38 @@ class TokenOptions:
     secret_key: Optional[str] = None  # ZEAL_SECRET_KEY for signing
 
 
+# Constant claims, pre-serialized for the hand-built payload fast path
+_STATIC_CLAIMS = ',"sdk_version":"1.0.0","application_id":"zeal-python-sdk"'
+
+
+@lru_cache(maxsize=8)
+def _hmac_prototype(secret_key: str) -> "hmac.HMAC":
+    """Keyed HMAC-SHA256 state, copied per signature to avoid re-keying"""
+    return hmac.new(secret_key.encode(), digestmod=hashlib.sha256)
+
+
+def _sign(secret_key: str, message: bytes) -> bytes:
+    """Compute the raw HMAC-SHA256 signature of message"""
+    mac = _hmac_prototype(secret_key).copy()
+    mac.update(message)
+    return mac.digest()
+
+
+# (second, formatted) pair, swapped as one object so readers never see a torn update
+_last_timestamp = (0, "")
+
+
+def _now_iso() -> str:
+    """UTC timestamp with second resolution, formatted at most once per second"""
+    global _last_timestamp
+    now = int(time.time())
+    second, formatted = _last_timestamp
+    if now != second:
+        formatted = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _last_timestamp = (now, formatted)
+    return formatted
+
+
 def generate_auth_token(
     subject: Union[TokenSubject, Dict[str, Any]],
     options: Optional[Union[TokenOptions, Dict[str, Any]]] = None
@@ -73,33 +124,37 @@ def generate_auth_token(
         )
     
     now = int(time.time())
+    session_id = token_urlsafe(12)
+    
+    # Fast path: subjects with only id/type/tenant_id and no claims other than
+    # exp are serialized by hand, producing the same bytes as orjson.dumps below
+    if not (
+        subject.organization_id or subject.teams or subject.groups or subject.roles
+        or subject.permissions or subject.metadata
+        or options.issuer or options.audience or options.not_before
+    ):
+        payload_string = (
+            f'{{"sub":{orjson.dumps(subject.id).decode()},"iat":{now}{_STATIC_CLAIMS}'
+            f',"session_id":"{session_id}"'
+        )
+        if subject.type:
+            payload_string += f',"type":{orjson.dumps(subject.type).decode()}'
+        if subject.tenant_id:
+            payload_string += f',"tenant_id":{orjson.dumps(subject.tenant_id).decode()}'
+        if options.expires_in:
+            payload_string += f',"exp":{now + options.expires_in}'
+        return _sign_payload((payload_string + "}").encode(), secret_key)
     
     payload = {
         "sub": subject.id,
         "iat": now,
         "sdk_version": "1.0.0",
         "application_id": "zeal-python-sdk",
-        "session_id": uuid.uuid4().hex[:16]
+        "session_id": session_id,
+        # Add subject fields
+        **subject.to_claims()
     }
     
-    # Add subject fields
-    if subject.type:
-        payload["type"] = subject.type
-    if subject.tenant_id:
-        payload["tenant_id"] = subject.tenant_id
-    if subject.organization_id:
-        payload["organization_id"] = subject.organization_id
-    if subject.teams:
-        payload["teams"] = subject.teams
-    if subject.groups:
-        payload["groups"] = subject.groups
-    if subject.roles:
-        payload["roles"] = subject.roles
-    if subject.permissions:
-        payload["permissions"] = subject.permissions
-    if subject.metadata:
-        payload["metadata"] = subject.metadata
-    
     # Add optional claims
     if options.expires_in:
         payload["exp"] = now + options.expires_in
@@ -110,30 +165,45 @@ def generate_auth_token(
     if options.not_before:
         payload["nbf"] = options.not_before
     
+    return _sign_payload(orjson.dumps(payload), secret_key)
+
+
+def _sign_payload(payload_bytes: bytes, secret_key: str) -> str:
+    """Encode a serialized payload as base64url and append its signature"""
     # Encode payload as base64url
-    payload_string = json.dumps(payload, separators=(',', ':'))
-    encoded_payload = base64.urlsafe_b64encode(
-        payload_string.encode()
-    ).decode().rstrip('=')
+    encoded_payload = base64.urlsafe_b64encode(payload_bytes).decode().rstrip('=')
     
     # Create HMAC signature
-    signature_bytes = hmac.new(
-        secret_key.encode(),
-        encoded_payload.encode(),
-        hashlib.sha256
-    ).digest()
+    signature_bytes = _sign(secret_key, encoded_payload.encode())
     signature = base64.urlsafe_b64encode(signature_bytes).decode().rstrip('=')
     
     # Return token in format: payload.signature
     return f"{encoded_payload}.{signature}"
 
 
-def verify_and_parse_token(token: str, secret_key: Optional[str] = None) -> Dict[str, Any]:
+def _b64url_decode(data: bytes) -> bytes:
+    """Decode unpadded base64url data, restoring the padding in one slice"""
+    return base64.urlsafe_b64decode(data + b"==="[:-len(data) % 4])
+
+
+def _split_token(token: Union[str, bytes]) -> List[bytes]:
+    """Split a token into its payload and signature segments as bytes"""
+    token_bytes = token.encode() if isinstance(token, str) else token
+    parts = token_bytes.split(b'.')
+    if len(parts) != 2:
+        raise ValueError('Invalid token format')
+    return parts
+
+
+def verify_and_parse_token(
+    token: Union[str, bytes],
+    secret_key: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Verify and parse a signed token
     
     Args:
-        token: Signed token string (payload.signature)
+        token: Signed token string or bytes (payload.signature)
         secret_key: Secret key for verification (optional, uses env var if not provided)
         
     Returns:
@@ -146,45 +216,30 @@ def verify_and_parse_token(token: str, secret_key: Optional[str] = None) -> Dict
     if not key:
         raise ValueError('ZEAL_SECRET_KEY is required for token verification')
     
-    parts = token.split('.')
-    if len(parts) != 2:
-        raise ValueError('Invalid token format')
-    
-    encoded_payload, signature = parts
+    encoded_payload, signature = _split_token(token)
     
     # Verify signature
-    expected_signature_bytes = hmac.new(
-        key.encode(),
-        encoded_payload.encode(),
-        hashlib.sha256
-    ).digest()
     expected_signature = base64.urlsafe_b64encode(
-        expected_signature_bytes
-    ).decode().rstrip('=')
+        _sign(key, encoded_payload)
+    ).rstrip(b'=')
     
-    if signature != expected_signature:
+    if not hmac.compare_digest(signature, expected_signature):
         raise ValueError('Invalid token signature')
     
     # Decode and parse payload
     try:
-        # Add padding if needed for base64 decoding
-        padding = 4 - (len(encoded_payload) % 4)
-        if padding != 4:
-            encoded_payload += '=' * padding
-        
-        decoded = base64.urlsafe_b64decode(encoded_payload).decode()
-        return json.loads(decoded)
+        return orjson.loads(_b64url_decode(encoded_payload))
     except Exception as e:
         raise ValueError(f'Invalid token payload: {e}')
 
 
-def parse_token_unsafe(token: str) -> Dict[str, Any]:
+def parse_token_unsafe(token: Union[str, bytes]) -> Dict[str, Any]:
     """
     Parse a token without verification (USE WITH CAUTION)
     Only use this for debugging or when you don't have the secret key
     
     Args:
-        token: Signed token string
+        token: Signed token string or bytes
         
     Returns:
         Parsed token payload
@@ -192,20 +247,10 @@ def parse_token_unsafe(token: str) -> Dict[str, Any]:
     Raises:
         ValueError: If token format is invalid
     """
-    parts = token.split('.')
-    if len(parts) != 2:
-        raise ValueError('Invalid token format')
-    
-    encoded_payload = parts[0]
+    encoded_payload = _split_token(token)[0]
     
     try:
-        # Add padding if needed for base64 decoding
-        padding = 4 - (len(encoded_payload) % 4)
-        if padding != 4:
-            encoded_payload += '=' * padding
-        
-        decoded = base64.urlsafe_b64decode(encoded_payload).decode()
-        return json.loads(decoded)
+        return orjson.loads(_b64url_decode(encoded_payload))
     except Exception as e:
         raise ValueError(f'Invalid token payload: {e}')
 
@@ -237,7 +282,7 @@ def create_service_token(
             permissions=permissions or [],
             metadata={
                 "service": True,
-                "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+                "created_at": _now_iso()
             }
         ),
         options
@@ -270,7 +315,7 @@ def create_user_token(
             tenant_id=tenant_id,
             roles=roles or [],
             metadata={
-                "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+                "created_at": _now_iso()
             }
         ),
         options
@@ -304,14 +349,14 @@ def create_api_key_token(
             permissions=permissions or [],
             metadata={
                 "api_key": True,
-                "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+                "created_at": _now_iso()
             }
         ),
         options
     )
 
 
-def is_token_valid(token: str, secret_key: Optional[str] = None) -> bool:
+def is_token_valid(token: Union[str, bytes], secret_key: Optional[str] = None) -> bool:
     """
     Validate token expiration and signature
     
@@ -1,19 +1,47 @@
 """Main Zeal client implementation."""
 
+import asyncio
+import gzip
+import random
+from importlib.util import find_spec
+from typing import Optional, Tuple
+
 import httpx
-from typing import Optional
+import orjson
 
-from .config import ClientConfig
+try:
+    import zstandard
+except ImportError:  # optional: pip install zeal-sdk[compression]
+    zstandard = None
 
-# SDK Constants
-SDK_VERSION = "1.0.0"
-APPLICATION_ID = "zeal-python-sdk"
+from .config import ClientConfig
 from .orchestrator import OrchestratorAPI
 from .templates import TemplatesAPI
 from .traces import TracesAPI
 from .webhooks import WebhooksAPI
 from .subscription import WebhookSubscription, SubscriptionOptions
-from .types import HealthCheckResponse
+from .types import HealthCheckResponse, _decode
+
+# SDK Constants
+SDK_VERSION = "1.0.0"
+APPLICATION_ID = "zeal-python-sdk"
+
+# Upper bound for a single retry delay, in seconds
+MAX_RETRY_BACKOFF_S = 30.0
+
+# HTTP/2 needs the optional ``h2`` package (pip install zeal-sdk[http2])
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Request bodies larger than this are compressed when compress_requests is set
+COMPRESSION_THRESHOLD_BYTES = 1024
+
+# httpx decodes zstd responses from 0.27 on, and only with zstandard installed
+HTTPX_DECODES_ZSTD = zstandard is not None and tuple(
+    int(part) for part in httpx.__version__.split(".")[:2]
+) >= (0, 27)
+
+# How long an idle pooled connection is kept before being closed, in seconds
+HTTP_KEEPALIVE_EXPIRY_S = 30.0
 
 
 class ZealClient:
@@ -31,6 +59,15 @@ class ZealClient:
         if not self.config.base_url:
             raise ValueError("Base URL cannot be empty")
         
+        # Per-request constants derived from the (immutable) configuration
+        self._base_url_stripped = self.config.base_url.rstrip('/')
+        
+        # Exponential retry delays; jitter is added per retry in _make_request
+        self._retry_jitter_s = self.config.retry_backoff_ms / 1000.0
+        self._backoffs = tuple(
+            self._retry_jitter_s * 2 ** attempt for attempt in range(self.config.max_retries)
+        )
+        
         # Create HTTP client
         timeout = httpx.Timeout(self.config.default_timeout.total_seconds())
         headers = {
@@ -42,10 +79,36 @@ class ZealClient:
         if self.config.auth_token:
             headers["Authorization"] = f"Bearer {self.config.auth_token}"
         
+        # Only advertise encodings httpx can decode in this environment
+        if not self.config.enable_compression:
+            headers["Accept-Encoding"] = "identity"
+        elif HTTPX_DECODES_ZSTD:
+            headers["Accept-Encoding"] = "zstd, gzip"
+        else:
+            headers["Accept-Encoding"] = "gzip"
+        
+        # Request compression is opt-in: the ZIP routes read request.json()
+        # and do not decode a Content-Encoding
+        self._zstd = None
+        if self.config.compress_requests and zstandard is not None:
+            self._zstd = zstandard.ZstdCompressor(level=3)
+        
+        # One pooled transport shared by every API module for the client's
+        # lifetime. Retries are handled by _make_request, so it must not retry.
+        transport = httpx.AsyncHTTPTransport(
+            verify=self.config.verify_tls,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                max_connections=self.config.max_connections,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_S,
+            ),
+            retries=0,
+        )
         self._http_client = httpx.AsyncClient(
             timeout=timeout,
-            verify=self.config.verify_tls,
-            headers=headers
+            headers=headers,
+            transport=transport,
         )
         
         # Initialize API modules
@@ -74,8 +137,11 @@ class ZealClient:
         await self.close()
     
     async def close(self):
-        """Close the HTTP client."""
-        await self._http_client.aclose()
+        """Send buffered trace events and close the HTTP client."""
+        try:
+            await self.traces.flush()
+        finally:
+            await self._http_client.aclose()
     
     @property
     def base_url(self) -> str:
@@ -84,19 +150,18 @@ class ZealClient:
     
     async def health(self) -> HealthCheckResponse:
         """Check service health."""
-        url = f"{self.config.base_url.rstrip('/')}/api/zip/health"
+        url = f"{self._base_url_stripped}/api/zip/health"
         
         response = await self._http_client.get(url)
-        response.raise_for_status()
-        
-        return HealthCheckResponse(**response.json())
+        return _decode(response, HealthCheckResponse)
     
     async def _make_request(
         self,
         method: str,
         path: str,
         json_data: Optional[dict] = None,
-        params: Optional[dict] = None
+        params: Optional[dict] = None,
+        content: Optional[bytes] = None
     ) -> httpx.Response:
         """Make an HTTP request with retries.
         
@@ -105,6 +170,7 @@ class ZealClient:
             path: API path (without base URL)
             json_data: JSON data to send in request body
             params: Query parameters
+            content: Pre-serialized JSON body, used instead of json_data
             
         Returns:
             HTTP response
@@ -112,15 +178,22 @@ class ZealClient:
         Raises:
             httpx.HTTPError: If request fails after retries
         """
-        url = f"{self.config.base_url.rstrip('/')}{path}"
+        url = f"{self._base_url_stripped}{path}"
+        if content is None and json_data is not None:
+            content = orjson.dumps(json_data)
+        content, headers = self._encode_body(content)
+        max_retries = self.config.max_retries
+        backoffs = self._backoffs
+        jitter_s = self._retry_jitter_s
         
         last_exception = None
-        for attempt in range(self.config.max_retries + 1):
+        for attempt in range(max_retries + 1):
             try:
                 response = await self._http_client.request(
                     method=method,
                     url=url,
-                    json=json_data,
+                    content=content,
+                    headers=headers,
                     params=params
                 )
                 
@@ -136,16 +209,30 @@ class ZealClient:
                 response.raise_for_status()  # Will raise for 5xx
                 
             except httpx.HTTPError as e:
+                # Client errors raised above are final
+                if isinstance(e, httpx.HTTPStatusError) and e.response.status_code < 500:
+                    raise
                 last_exception = e
-                if attempt < self.config.max_retries:
-                    # Wait before retry
-                    await asyncio.sleep(self.config.retry_backoff_ms / 1000.0)
+                if attempt < max_retries:
+                    # Wait before retry, with fresh jitter so concurrent requests
+                    # don't retry a struggling server in lockstep
+                    await asyncio.sleep(
+                        min(MAX_RETRY_BACKOFF_S, backoffs[attempt] + random.random() * jitter_s)
+                    )
                     continue
                 break
         
         # All retries failed
         raise last_exception or httpx.RequestError("Request failed")
-
-
-# Import asyncio for sleep function
-import asyncio
\ No newline at end of file
+    
+    def _encode_body(self, body: Optional[bytes]) -> Tuple[Optional[bytes], Optional[dict]]:
+        """Compress a serialized JSON body if large, as (content, extra headers)."""
+        if body is None:
+            return None, None
+        
+        if not self.config.compress_requests or len(body) <= COMPRESSION_THRESHOLD_BYTES:
+            return body, None
+        
+        if self._zstd is not None:
+            return self._zstd.compress(body), {"Content-Encoding": "zstd"}
+        return gzip.compress(body, compresslevel=6), {"Content-Encoding": "gzip"}
\ No newline at end of file
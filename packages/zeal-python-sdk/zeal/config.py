@@ -1,21 +1,37 @@
 """Client configuration for Zeal SDK."""
 
+import sys
+from dataclasses import dataclass, fields
 from datetime import timedelta
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Any, Dict, Optional
 
+# Shared immutable defaults, created once at import
+_DEFAULT_BASE_URL = "http://localhost:3000"
+_DEFAULT_TIMEOUT = timedelta(seconds=30)
+_DEFAULT_USER_AGENT = "zeal-python-sdk/1.0.0"
 
-class ClientConfig(BaseModel):
+# Slotted dataclasses are only available on Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class ClientConfig:
     """Configuration for Zeal client."""
-    
-    base_url: str = Field(default="http://localhost:3000", description="Base URL for the Zeal API")
-    auth_token: Optional[str] = Field(default=None, description="Authentication token for API access")
-    default_timeout: timedelta = Field(default=timedelta(seconds=30), description="Default request timeout")
-    verify_tls: bool = Field(default=True, description="Whether to verify TLS certificates")
-    user_agent: str = Field(default="zeal-python-sdk/1.0.0", description="User agent string")
-    max_retries: int = Field(default=3, description="Maximum number of retries for requests")
-    retry_backoff_ms: int = Field(default=1000, description="Backoff time in milliseconds between retries")
-    enable_compression: bool = Field(default=True, description="Whether to enable compression")
-    
-    class Config:
-        arbitrary_types_allowed = True
\ No newline at end of file
+
+    base_url: str = _DEFAULT_BASE_URL  # Base URL for the Zeal API
+    auth_token: Optional[str] = None  # Authentication token for API access
+    default_timeout: timedelta = _DEFAULT_TIMEOUT  # Default request timeout
+    verify_tls: bool = True  # Whether to verify TLS certificates
+    user_agent: str = _DEFAULT_USER_AGENT  # User agent string
+    max_retries: int = 3  # Maximum number of retries for requests
+    retry_backoff_ms: int = 1000  # Backoff time in milliseconds between retries
+    enable_compression: bool = True  # Whether to accept compressed responses
+    compress_requests: bool = False  # Compress large request bodies; the server must decode Content-Encoding
+    max_connections: int = 64  # Connection pool size shared by all API calls
+    max_keepalive_connections: int = 32  # Idle connections kept open for reuse
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ClientConfig":
+        """Create a configuration from a dict, ignoring unknown keys."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
@@ -1,68 +1,60 @@
 """ZIP event types and utilities for Zeal SDK."""
 
-import uuid
+import secrets
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Type, Union
-from pydantic import BaseModel, Field
+from enum import IntFlag
+from typing import Any, Dict, List, Literal, Optional, Type, TypeVar, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing_extensions import Annotated
 
+from .types import JsonObject, _AliasModel
 
-class ZipEventBase(BaseModel):
+
+class ZipEventBase(_AliasModel):
     """Base event structure for all ZIP events."""
+    # Events sit on the webhook hot path, so their schemas are built at import
+    model_config = ConfigDict(defer_build=False)
+    
     id: str
     timestamp: str
-    workflow_id: str = Field(alias="workflowId")
-    graph_id: Optional[str] = Field(default=None, alias="graphId")
-    metadata: Optional[Dict[str, Any]] = None
-    
-    class Config:
-        populate_by_name = True
+    workflow_id: str
+    graph_id: Optional[str] = None
+    metadata: Optional[JsonObject] = None
 
 
 # === Execution Events ===
 
 class NodeExecutingEvent(ZipEventBase):
     """Node execution started event."""
-    type: str = "node.executing"
-    node_id: str = Field(alias="nodeId")
-    input_connections: List[str] = Field(alias="inputConnections")
-    
-    class Config:
-        populate_by_name = True
+    type: Literal["node.executing"] = "node.executing"
+    node_id: str
+    input_connections: List[str]
 
 
 class NodeCompletedEvent(ZipEventBase):
     """Node execution completed event."""
-    type: str = "node.completed"
-    node_id: str = Field(alias="nodeId")
-    output_connections: List[str] = Field(alias="outputConnections")
+    type: Literal["node.completed"] = "node.completed"
+    node_id: str
+    output_connections: List[str]
     duration: Optional[int] = None
-    output_size: Optional[int] = Field(default=None, alias="outputSize")
-    
-    class Config:
-        populate_by_name = True
+    output_size: Optional[int] = None
 
 
 class NodeFailedEvent(ZipEventBase):
     """Node execution failed event."""
-    type: str = "node.failed"
-    node_id: str = Field(alias="nodeId")
-    output_connections: List[str] = Field(alias="outputConnections")
+    type: Literal["node.failed"] = "node.failed"
+    node_id: str
+    output_connections: List[str]
     error: Optional["NodeError"] = None
-    
-    class Config:
-        populate_by_name = True
 
 
 class NodeWarningEvent(ZipEventBase):
     """Node execution completed with warnings event."""
-    type: str = "node.warning"
-    node_id: str = Field(alias="nodeId")
-    output_connections: List[str] = Field(alias="outputConnections")
+    type: Literal["node.warning"] = "node.warning"
+    node_id: str
+    output_connections: List[str]
     warning: Optional["NodeWarning"] = None
-    
-    class Config:
-        populate_by_name = True
 
 
 class NodeError(BaseModel):
@@ -80,36 +72,27 @@ class NodeWarning(BaseModel):
 
 class ExecutionStartedEvent(ZipEventBase):
     """Workflow execution started event."""
-    type: str = "execution.started"
-    session_id: str = Field(alias="sessionId")
-    workflow_name: str = Field(alias="workflowName")
+    type: Literal["execution.started"] = "execution.started"
+    session_id: str
+    workflow_name: str
     trigger: Optional["ExecutionTrigger"] = None
-    
-    class Config:
-        populate_by_name = True
 
 
 class ExecutionCompletedEvent(ZipEventBase):
     """Workflow execution completed event."""
-    type: str = "execution.completed"
-    session_id: str = Field(alias="sessionId")
+    type: Literal["execution.completed"] = "execution.completed"
+    session_id: str
     duration: int
-    nodes_executed: int = Field(alias="nodesExecuted")
+    nodes_executed: int
     summary: Optional["ExecutionSummary"] = None
-    
-    class Config:
-        populate_by_name = True
 
 
 class ExecutionFailedEvent(ZipEventBase):
     """Workflow execution failed event."""
-    type: str = "execution.failed"
-    session_id: str = Field(alias="sessionId")
+    type: Literal["execution.failed"] = "execution.failed"
+    session_id: str
     duration: Optional[int] = None
     error: Optional["ExecutionError"] = None
-    
-    class Config:
-        populate_by_name = True
 
 
 class ExecutionTrigger(BaseModel):
@@ -118,234 +101,196 @@ class ExecutionTrigger(BaseModel):
     source: Optional[str] = None
 
 
-class ExecutionSummary(BaseModel):
+class ExecutionSummary(_AliasModel):
     """Execution summary statistics."""
-    success_count: int = Field(alias="successCount")
-    error_count: int = Field(alias="errorCount")
-    warning_count: int = Field(alias="warningCount")
-    
-    class Config:
-        populate_by_name = True
+    success_count: int
+    error_count: int
+    warning_count: int
 
 
-class ExecutionError(BaseModel):
+class ExecutionError(_AliasModel):
     """Execution error information."""
     message: str
     code: Optional[str] = None
-    node_id: Optional[str] = Field(default=None, alias="nodeId")
-    
-    class Config:
-        populate_by_name = True
+    node_id: Optional[str] = None
+
+
+# Resolve the forward references above now, so the first event parsed
+# doesn't pay for building these schemas
+for _event_class in (
+    NodeFailedEvent, NodeWarningEvent,
+    ExecutionStartedEvent, ExecutionCompletedEvent, ExecutionFailedEvent,
+):
+    _event_class.model_rebuild()
+del _event_class
 
 
 # === Workflow Events ===
 
 class WorkflowCreatedEvent(ZipEventBase):
     """Workflow created event."""
-    type: str = "workflow.created"
-    workflow_name: str = Field(alias="workflowName")
-    user_id: Optional[str] = Field(default=None, alias="userId")
-    
-    class Config:
-        populate_by_name = True
+    type: Literal["workflow.created"] = "workflow.created"
+    workflow_name: str
+    user_id: Optional[str] = None
 
 
 class WorkflowUpdatedEvent(ZipEventBase):
     """Workflow updated event."""
-    type: str = "workflow.updated"
-    data: Optional[Dict[str, Any]] = None
+    type: Literal["workflow.updated"] = "workflow.updated"
+    data: Optional[JsonObject] = None
 
 
 class WorkflowDeletedEvent(ZipEventBase):
     """Workflow deleted event."""
-    type: str = "workflow.deleted"
-    workflow_name: Optional[str] = Field(default=None, alias="workflowName")
-    
-    class Config:
-        populate_by_name = True
+    type: Literal["workflow.deleted"] = "workflow.deleted"
+    workflow_name: Optional[str] = None
 
 
 class WorkflowPublishedEvent(ZipEventBase):
     """Workflow published event — version is ready for execution."""
-    type: str = "workflow.published"
-    workflow_name: str = Field(alias="workflowName")
+    type: Literal["workflow.published"] = "workflow.published"
+    workflow_name: str
     version: int
-    version_id: str = Field(alias="versionId")
-    user_id: Optional[str] = Field(default=None, alias="userId")
+    version_id: str
+    user_id: Optional[str] = None
     graphs: Optional[Any] = None
 
-    class Config:
-        populate_by_name = True
-
 
 class WorkflowUnpublishedEvent(ZipEventBase):
     """Workflow unpublished event — removed from execution."""
-    type: str = "workflow.unpublished"
-    workflow_name: Optional[str] = Field(default=None, alias="workflowName")
-    user_id: Optional[str] = Field(default=None, alias="userId")
-
-    class Config:
-        populate_by_name = True
+    type: Literal["workflow.unpublished"] = "workflow.unpublished"
+    workflow_name: Optional[str] = None
+    user_id: Optional[str] = None
 
 
 # === CRDT Events ===
 
 class NodeAddedEvent(ZipEventBase):
     """Node added to workflow event."""
-    type: str = "node.added"
-    node_id: str = Field(alias="nodeId")
-    data: Dict[str, Any]
-    
-    class Config:
-        populate_by_name = True
+    type: Literal["node.added"] = "node.added"
+    node_id: str
+    data: JsonObject
 
 
 class NodeUpdatedEvent(ZipEventBase):
     """Node updated event."""
-    type: str = "node.updated"
-    node_id: str = Field(alias="nodeId")
-    data: Dict[str, Any]
-    
-    class Config:
-        populate_by_name = True
+    type: Literal["node.updated"] = "node.updated"
+    node_id: str
+    data: JsonObject
 
 
 class NodeDeletedEvent(ZipEventBase):
     """Node deleted event."""
-    type: str = "node.deleted"
-    node_id: str = Field(alias="nodeId")
-    
-    class Config:
-        populate_by_name = True
+    type: Literal["node.deleted"] = "node.deleted"
+    node_id: str
 
 
 class ConnectionAddedEvent(ZipEventBase):
     """Connection added event."""
-    type: str = "connection.added"
-    data: Dict[str, Any]
+    type: Literal["connection.added"] = "connection.added"
+    data: JsonObject
 
 
 class ConnectionDeletedEvent(ZipEventBase):
     """Connection deleted event."""
-    type: str = "connection.deleted"
-    data: Dict[str, Any]
+    type: Literal["connection.deleted"] = "connection.deleted"
+    data: JsonObject
 
 
 class GroupCreatedEvent(ZipEventBase):
     """Group created event."""
-    type: str = "group.created"
-    data: Dict[str, Any]
+    type: Literal["group.created"] = "group.created"
+    data: JsonObject
 
 
 class GroupUpdatedEvent(ZipEventBase):
     """Group updated event."""
-    type: str = "group.updated"
-    data: Dict[str, Any]
+    type: Literal["group.updated"] = "group.updated"
+    data: JsonObject
 
 
 class GroupDeletedEvent(ZipEventBase):
     """Group deleted event."""
-    type: str = "group.deleted"
-    data: Dict[str, Any]
+    type: Literal["group.deleted"] = "group.deleted"
+    data: JsonObject
 
 
 class TemplateRegisteredEvent(ZipEventBase):
     """Template registered event."""
-    type: str = "template.registered"
-    data: Dict[str, Any]
+    type: Literal["template.registered"] = "template.registered"
+    data: JsonObject
 
 
 class TraceEventData(ZipEventBase):
     """Trace event."""
-    type: str = "trace.event"
-    session_id: str = Field(alias="sessionId")
-    node_id: str = Field(alias="nodeId")
-    data: Dict[str, Any]
-    
-    class Config:
-        populate_by_name = True
+    type: Literal["trace.event"] = "trace.event"
+    session_id: str
+    node_id: str
+    data: JsonObject
 
 
 # === Stream Events ===
 
 class StreamOpenedEvent(ZipEventBase):
     """Stream opened event - a node is producing a binary stream."""
-    type: str = "stream.opened"
-    node_id: str = Field(alias="nodeId")
+    type: Literal["stream.opened"] = "stream.opened"
+    node_id: str
     port: str
-    stream_id: int = Field(alias="streamId")
-    content_type: Optional[str] = Field(default=None, alias="contentType")
-    size_hint: Optional[int] = Field(default=None, alias="sizeHint")
-
-    class Config:
-        populate_by_name = True
+    stream_id: int
+    content_type: Optional[str] = None
+    size_hint: Optional[int] = None
 
 
 class StreamClosedEvent(ZipEventBase):
     """Stream closed event - a stream terminated normally."""
-    type: str = "stream.closed"
-    node_id: str = Field(alias="nodeId")
-    stream_id: int = Field(alias="streamId")
-    total_bytes: int = Field(alias="totalBytes")
-
-    class Config:
-        populate_by_name = True
+    type: Literal["stream.closed"] = "stream.closed"
+    node_id: str
+    stream_id: int
+    total_bytes: int
 
 
 class StreamErrorEvent(ZipEventBase):
     """Stream error event - a stream terminated with an error."""
-    type: str = "stream.error"
-    node_id: str = Field(alias="nodeId")
-    stream_id: int = Field(alias="streamId")
+    type: Literal["stream.error"] = "stream.error"
+    node_id: str
+    stream_id: int
     error: str
 
-    class Config:
-        populate_by_name = True
-
 
 # === Control Events ===
 
-class SubscribeEvent(BaseModel):
+class SubscribeEvent(_AliasModel):
     """WebSocket subscribe event."""
-    type: str = "subscribe"
-    workflow_id: str = Field(alias="workflowId")
-    graph_id: Optional[str] = Field(default=None, alias="graphId")
-    
-    class Config:
-        populate_by_name = True
+    type: Literal["subscribe"] = "subscribe"
+    workflow_id: str
+    graph_id: Optional[str] = None
 
 
-class UnsubscribeEvent(BaseModel):
+class UnsubscribeEvent(_AliasModel):
     """WebSocket unsubscribe event."""
-    type: str = "unsubscribe"
-    workflow_id: Optional[str] = Field(default=None, alias="workflowId")
-    
-    class Config:
-        populate_by_name = True
+    type: Literal["unsubscribe"] = "unsubscribe"
+    workflow_id: Optional[str] = None
 
 
 class PingEvent(BaseModel):
     """WebSocket ping event."""
-    type: str = "ping"
+    type: Literal["ping"] = "ping"
     timestamp: int
 
 
 class PongEvent(BaseModel):
     """WebSocket pong event."""
-    type: str = "pong"
+    type: Literal["pong"] = "pong"
     timestamp: int
 
 
 class ConnectionStateEvent(ZipEventBase):
     """Connection state change event."""
-    type: str = "connection.state"
-    connection_id: str = Field(alias="connectionId")
+    type: Literal["connection.state"] = "connection.state"
+    connection_id: str
     state: str  # idle, active, success, error
-    source_node_id: str = Field(alias="sourceNodeId")
-    target_node_id: str = Field(alias="targetNodeId")
-    
-    class Config:
-        populate_by_name = True
+    source_node_id: str
+    target_node_id: str
 
 
 # Union types
@@ -411,76 +356,163 @@ ZipWebhookEvent = Union[
 
 
 # Type guards
+_EXECUTION_EVENT_TYPES = frozenset({
+    "node.executing", "node.completed", "node.failed", "node.warning",
+    "execution.started", "execution.completed", "execution.failed"
+})
+
+_CRDT_EVENT_TYPES = frozenset({
+    "node.added", "node.updated", "node.deleted",
+    "connection.added", "connection.deleted",
+    "group.created", "group.updated", "group.deleted",
+    "template.registered", "trace.event"
+})
+
+_CONTROL_EVENT_TYPES = frozenset({"subscribe", "unsubscribe", "ping", "pong"})
+
+_NODE_EVENT_TYPES = frozenset({
+    "node.executing", "node.completed", "node.failed", "node.warning",
+    "node.added", "node.updated", "node.deleted"
+})
+
+_CONNECTION_CRDT_EVENT_TYPES = frozenset({"connection.added", "connection.deleted"})
+
+_WORKFLOW_EVENT_TYPES = frozenset({
+    "workflow.created", "workflow.updated", "workflow.deleted",
+    "workflow.published", "workflow.unpublished"
+})
+
+_GROUP_EVENT_TYPES = frozenset({"group.created", "group.updated", "group.deleted"})
+
+_TEMPLATE_EVENT_TYPES = frozenset({"template.registered"})
+
+_STREAM_EVENT_TYPES = frozenset({"stream.opened", "stream.closed", "stream.error"})
+
+
 def is_execution_event(event_type: str) -> bool:
     """Check if event type is an execution event."""
-    execution_types = {
-        "node.executing", "node.completed", "node.failed", "node.warning",
-        "execution.started", "execution.completed", "execution.failed"
-    }
-    return event_type in execution_types
+    return event_type in _EXECUTION_EVENT_TYPES
 
 
 def is_workflow_event(event_type: str) -> bool:
     """Check if event type is a workflow event."""
-    return event_type.startswith("workflow.")
+    return event_type in _WORKFLOW_EVENT_TYPES
 
 
 def is_crdt_event(event_type: str) -> bool:
     """Check if event type is a CRDT event."""
-    crdt_types = {
-        "node.added", "node.updated", "node.deleted",
-        "connection.added", "connection.deleted",
-        "group.created", "group.updated", "group.deleted",
-        "template.registered", "trace.event"
-    }
-    return event_type in crdt_types
+    return event_type in _CRDT_EVENT_TYPES
 
 
 def is_control_event(event_type: str) -> bool:
     """Check if event type is a control event."""
-    return event_type in {"subscribe", "unsubscribe", "ping", "pong"}
+    return event_type in _CONTROL_EVENT_TYPES
 
 
 def is_node_event(event_type: str) -> bool:
     """Check if event type is a node-related event."""
-    node_types = {
-        "node.executing", "node.completed", "node.failed", "node.warning",
-        "node.added", "node.updated", "node.deleted"
-    }
-    return event_type in node_types
+    return event_type in _NODE_EVENT_TYPES
 
 
 def is_group_event(event_type: str) -> bool:
     """Check if event type is a group-related event."""
-    return event_type.startswith("group.")
+    return event_type in _GROUP_EVENT_TYPES
 
 
 def is_connection_crdt_event(event_type: str) -> bool:
     """Check if event type is a connection CRDT event."""
-    return event_type in {"connection.added", "connection.deleted"}
+    return event_type in _CONNECTION_CRDT_EVENT_TYPES
 
 
 def is_template_event(event_type: str) -> bool:
     """Check if event type is a template-related event."""
-    return event_type.startswith("template.")
+    return event_type in _TEMPLATE_EVENT_TYPES
 
 
 def is_stream_event(event_type: str) -> bool:
     """Check if event type is a stream event."""
-    return event_type.startswith("stream.")
+    return event_type in _STREAM_EVENT_TYPES
+
+
+class EventCategory(IntFlag):
+    """Bit flags for the categories an event type belongs to."""
+    NONE = 0
+    EXECUTION = 1
+    WORKFLOW = 2
+    CRDT = 4
+    CONTROL = 8
+    NODE = 16
+    GROUP = 32
+    CONNECTION = 64
+    TEMPLATE = 128
+    STREAM = 256
+
+
+def _build_category_table() -> Dict[str, EventCategory]:
+    """Combine the type guard sets into one event type -> categories table."""
+    table: Dict[str, EventCategory] = {}
+    for category, event_types in (
+        (EventCategory.EXECUTION, _EXECUTION_EVENT_TYPES),
+        (EventCategory.WORKFLOW, _WORKFLOW_EVENT_TYPES),
+        (EventCategory.CRDT, _CRDT_EVENT_TYPES),
+        (EventCategory.CONTROL, _CONTROL_EVENT_TYPES),
+        (EventCategory.NODE, _NODE_EVENT_TYPES),
+        (EventCategory.GROUP, _GROUP_EVENT_TYPES),
+        (EventCategory.CONNECTION, _CONNECTION_CRDT_EVENT_TYPES),
+        (EventCategory.TEMPLATE, _TEMPLATE_EVENT_TYPES),
+        (EventCategory.STREAM, _STREAM_EVENT_TYPES),
+    ):
+        for event_type in event_types:
+            table[event_type] = table.get(event_type, EventCategory.NONE) | category
+    return table
+
+
+_EVENT_CATEGORIES = _build_category_table()
+
+
+def classify_event(event_type: str) -> EventCategory:
+    """Get all categories of an event type with a single lookup."""
+    return _EVENT_CATEGORIES.get(event_type, EventCategory.NONE)
 
 
 # Event creation helpers
 def generate_event_id() -> str:
-    """Generate a unique event ID."""
-    timestamp = int(datetime.now(timezone.utc).timestamp() * 1000)
-    random_part = str(uuid.uuid4()).replace('-', '')[:11]
-    return f"evt_{timestamp}_{random_part}"
+    """Generate a unique, time-ordered event ID."""
+    return f"evt_{time.time_ns() // 1_000_000}_{secrets.token_hex(6)}"
+
+
+# (second, "YYYY-MM-DDTHH:MM:SS") for the most recent second, swapped as one object
+_last_second_prefix = (0, "")
 
 
 def current_timestamp() -> str:
     """Get current timestamp in ISO format."""
-    return datetime.now(timezone.utc).isoformat()
+    global _last_second_prefix
+    second, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _last_second_prefix
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _last_second_prefix = (second, prefix)
+    return f"{prefix}.{ns // 1000:06d}+00:00"
+
+
+_EventT = TypeVar("_EventT", bound=ZipEventBase)
+
+
+def _make_event(
+    cls: Type[_EventT],
+    workflow_id: str,
+    graph_id: Optional[str],
+    **fields: Any
+) -> _EventT:
+    """Build an event of the given class with a fresh id and timestamp."""
+    return cls(
+        id=generate_event_id(),
+        timestamp=current_timestamp(),
+        workflow_id=workflow_id,
+        graph_id=graph_id,
+        **fields
+    )
 
 
 def create_node_added_event(
@@ -490,14 +522,7 @@ def create_node_added_event(
     graph_id: Optional[str] = None
 ) -> NodeAddedEvent:
     """Create a node added event."""
-    return NodeAddedEvent(
-        id=generate_event_id(),
-        timestamp=current_timestamp(),
-        workflow_id=workflow_id,
-        graph_id=graph_id,
-        node_id=node_id,
-        data=data
-    )
+    return _make_event(NodeAddedEvent, workflow_id, graph_id, node_id=node_id, data=data)
 
 
 def create_node_updated_event(
@@ -507,14 +532,7 @@ def create_node_updated_event(
     graph_id: Optional[str] = None
 ) -> NodeUpdatedEvent:
     """Create a node updated event."""
-    return NodeUpdatedEvent(
-        id=generate_event_id(),
-        timestamp=current_timestamp(),
-        workflow_id=workflow_id,
-        graph_id=graph_id,
-        node_id=node_id,
-        data=data
-    )
+    return _make_event(NodeUpdatedEvent, workflow_id, graph_id, node_id=node_id, data=data)
 
 
 def create_node_deleted_event(
@@ -523,13 +541,7 @@ def create_node_deleted_event(
     graph_id: Optional[str] = None
 ) -> NodeDeletedEvent:
     """Create a node deleted event."""
-    return NodeDeletedEvent(
-        id=generate_event_id(),
-        timestamp=current_timestamp(),
-        workflow_id=workflow_id,
-        graph_id=graph_id,
-        node_id=node_id
-    )
+    return _make_event(NodeDeletedEvent, workflow_id, graph_id, node_id=node_id)
 
 
 def create_group_created_event(
@@ -538,13 +550,7 @@ def create_group_created_event(
     graph_id: Optional[str] = None
 ) -> GroupCreatedEvent:
     """Create a group created event."""
-    return GroupCreatedEvent(
-        id=generate_event_id(),
-        timestamp=current_timestamp(),
-        workflow_id=workflow_id,
-        graph_id=graph_id,
-        data=data
-    )
+    return _make_event(GroupCreatedEvent, workflow_id, graph_id, data=data)
 
 
 def create_group_updated_event(
@@ -553,13 +559,7 @@ def create_group_updated_event(
     graph_id: Optional[str] = None
 ) -> GroupUpdatedEvent:
     """Create a group updated event."""
-    return GroupUpdatedEvent(
-        id=generate_event_id(),
-        timestamp=current_timestamp(),
-        workflow_id=workflow_id,
-        graph_id=graph_id,
-        data=data
-    )
+    return _make_event(GroupUpdatedEvent, workflow_id, graph_id, data=data)
 
 
 def create_group_deleted_event(
@@ -568,13 +568,7 @@ def create_group_deleted_event(
     graph_id: Optional[str] = None
 ) -> GroupDeletedEvent:
     """Create a group deleted event."""
-    return GroupDeletedEvent(
-        id=generate_event_id(),
-        timestamp=current_timestamp(),
-        workflow_id=workflow_id,
-        graph_id=graph_id,
-        data=data
-    )
+    return _make_event(GroupDeletedEvent, workflow_id, graph_id, data=data)
 
 
 def create_connection_added_event(
@@ -583,13 +577,7 @@ def create_connection_added_event(
     graph_id: Optional[str] = None
 ) -> ConnectionAddedEvent:
     """Create a connection added event."""
-    return ConnectionAddedEvent(
-        id=generate_event_id(),
-        timestamp=current_timestamp(),
-        workflow_id=workflow_id,
-        graph_id=graph_id,
-        data=data
-    )
+    return _make_event(ConnectionAddedEvent, workflow_id, graph_id, data=data)
 
 
 def create_connection_deleted_event(
@@ -598,13 +586,7 @@ def create_connection_deleted_event(
     graph_id: Optional[str] = None
 ) -> ConnectionDeletedEvent:
     """Create a connection deleted event."""
-    return ConnectionDeletedEvent(
-        id=generate_event_id(),
-        timestamp=current_timestamp(),
-        workflow_id=workflow_id,
-        graph_id=graph_id,
-        data=data
-    )
+    return _make_event(ConnectionDeletedEvent, workflow_id, graph_id, data=data)
 
 
 def create_stream_opened_event(
@@ -617,11 +599,8 @@ def create_stream_opened_event(
     graph_id: Optional[str] = None
 ) -> StreamOpenedEvent:
     """Create a stream opened event."""
-    return StreamOpenedEvent(
-        id=generate_event_id(),
-        timestamp=current_timestamp(),
-        workflow_id=workflow_id,
-        graph_id=graph_id,
+    return _make_event(
+        StreamOpenedEvent, workflow_id, graph_id,
         node_id=node_id,
         port=port,
         stream_id=stream_id,
@@ -638,11 +617,8 @@ def create_stream_closed_event(
     graph_id: Optional[str] = None
 ) -> StreamClosedEvent:
     """Create a stream closed event."""
-    return StreamClosedEvent(
-        id=generate_event_id(),
-        timestamp=current_timestamp(),
-        workflow_id=workflow_id,
-        graph_id=graph_id,
+    return _make_event(
+        StreamClosedEvent, workflow_id, graph_id,
         node_id=node_id,
         stream_id=stream_id,
         total_bytes=total_bytes
@@ -657,11 +633,8 @@ def create_stream_error_event(
     graph_id: Optional[str] = None
 ) -> StreamErrorEvent:
     """Create a stream error event."""
-    return StreamErrorEvent(
-        id=generate_event_id(),
-        timestamp=current_timestamp(),
-        workflow_id=workflow_id,
-        graph_id=graph_id,
+    return _make_event(
+        StreamErrorEvent, workflow_id, graph_id,
         node_id=node_id,
         stream_id=stream_id,
         error=error
@@ -734,8 +707,18 @@ EVENT_TYPE_MAP: Dict[str, Type[ZipWebhookEvent]] = {
 }
 
 
-def parse_zip_webhook_event(data: Dict[str, Any]) -> ZipWebhookEvent:
-    """Parse a ZIP webhook event from raw data."""
+# Tagged union over the "type" field: pydantic-core picks the event class and
+# validates in one pass straight from JSON bytes, without an intermediate dict
+_WEBHOOK_EVENT_ADAPTER: TypeAdapter = TypeAdapter(
+    Annotated[ZipWebhookEvent, Field(discriminator="type")]
+)
+
+
+def parse_zip_webhook_event(data: Union[Dict[str, Any], str, bytes]) -> ZipWebhookEvent:
+    """Parse a ZIP webhook event from raw data or an undecoded JSON body."""
+    if isinstance(data, (bytes, str)):
+        return _WEBHOOK_EVENT_ADAPTER.validate_json(data)
+    
     event_type = data.get("type")
     if not event_type:
         raise ValueError("Event data missing 'type' field")
@@ -744,4 +727,4 @@ def parse_zip_webhook_event(data: Dict[str, Any]) -> ZipWebhookEvent:
     if not event_class:
         raise ValueError(f"Unknown event type: {event_type}")
     
-    return event_class(**data)
\ No newline at end of file
+    return event_class.model_validate(data)
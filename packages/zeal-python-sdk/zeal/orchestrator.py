@@ -1,12 +1,17 @@
 """Orchestrator API implementation."""
 
-from typing import Optional, TYPE_CHECKING
+import asyncio
+from typing import Any, Awaitable, List, Optional, TYPE_CHECKING
+
+import httpx
+from pydantic_core import to_json
 
 from .types import (
+    _decode, _encode,
     CreateWorkflowRequest, CreateWorkflowResponse,
     ListWorkflowsParams, ListWorkflowsResponse,
     WorkflowState,
-    AddNodeRequest, AddNodeResponse,
+    AddNodeRequest, AddNodeResponse, AddNodesBulkResponse,
     UpdateNodeRequest, UpdateNodeResponse,
     DeleteNodeResponse,
     ConnectNodesRequest, ConnectionResponse,
@@ -20,35 +25,104 @@ if TYPE_CHECKING:
     from .client import ZealClient
 
 
+class OrchestratorBatch:
+    """Runs orchestrator calls concurrently and awaits them all on exit.
+    
+    Each method schedules the call immediately and returns its task, so
+    results can be read after the ``async with`` block.
+    """
+    
+    def __init__(self, api: "OrchestratorAPI"):
+        self._api = api
+        self._tasks: List["asyncio.Task[Any]"] = []
+    
+    def _schedule(self, coro: Awaitable[Any]) -> "asyncio.Task[Any]":
+        """Start a call now and track it until the batch exits."""
+        task = asyncio.ensure_future(coro)
+        self._tasks.append(task)
+        return task
+    
+    def add_node(self, request: AddNodeRequest) -> "asyncio.Task[AddNodeResponse]":
+        """Schedule adding a node."""
+        return self._schedule(self._api.add_node(request))
+    
+    def update_node(self, node_id: str, request: UpdateNodeRequest) -> "asyncio.Task[UpdateNodeResponse]":
+        """Schedule a node update."""
+        return self._schedule(self._api.update_node(node_id, request))
+    
+    def delete_node(
+        self,
+        node_id: str,
+        workflow_id: str,
+        graph_id: Optional[str] = None
+    ) -> "asyncio.Task[DeleteNodeResponse]":
+        """Schedule deleting a node."""
+        return self._schedule(self._api.delete_node(node_id, workflow_id, graph_id))
+    
+    def connect_nodes(self, request: ConnectNodesRequest) -> "asyncio.Task[ConnectionResponse]":
+        """Schedule connecting two nodes."""
+        return self._schedule(self._api.connect_nodes(request))
+    
+    def remove_connection(self, request: RemoveConnectionRequest) -> "asyncio.Task[RemoveConnectionResponse]":
+        """Schedule removing a connection."""
+        return self._schedule(self._api.remove_connection(request))
+    
+    def create_group(self, request: CreateGroupRequest) -> "asyncio.Task[CreateGroupResponse]":
+        """Schedule creating a node group."""
+        return self._schedule(self._api.create_group(request))
+    
+    def update_group(self, request: UpdateGroupRequest) -> "asyncio.Task[UpdateGroupResponse]":
+        """Schedule a group update."""
+        return self._schedule(self._api.update_group(request))
+    
+    def remove_group(self, request: RemoveGroupRequest) -> "asyncio.Task[RemoveGroupResponse]":
+        """Schedule removing a group."""
+        return self._schedule(self._api.remove_group(request))
+    
+    async def __aenter__(self) -> "OrchestratorBatch":
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Wait for all scheduled calls, raising the first failure."""
+        if exc_type is not None:
+            for task in self._tasks:
+                task.cancel()
+        
+        results = await asyncio.gather(*self._tasks, return_exceptions=True)
+        if exc_type is None:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+
 class OrchestratorAPI:
     """Orchestrator API for workflow management."""
     
     def __init__(self, client: "ZealClient"):
         self._client = client
     
+    def batch(self) -> OrchestratorBatch:
+        """Run several calls concurrently: ``async with api.batch() as b: b.add_node(...)``."""
+        return OrchestratorBatch(self)
+    
     async def create_workflow(self, request: CreateWorkflowRequest) -> CreateWorkflowResponse:
         """Create a new workflow."""
         response = await self._client._make_request(
             "POST",
             "/api/zip/orchestrator/workflows",
-            json_data=request.dict(by_alias=True, exclude_none=True)
+            content=_encode(request)
         )
-        response.raise_for_status()
-        return CreateWorkflowResponse(**response.json())
+        return _decode(response, CreateWorkflowResponse)
     
     async def list_workflows(self, params: Optional[ListWorkflowsParams] = None) -> ListWorkflowsResponse:
         """List existing workflows."""
-        query_params = None
-        if params:
-            query_params = params.dict(exclude_none=True)
-        
         response = await self._client._make_request(
             "GET",
             "/api/zip/orchestrator/workflows",
-            params=query_params
+            params=params.to_query() if params else None
         )
-        response.raise_for_status()
-        return ListWorkflowsResponse(**response.json())
+        return _decode(response, ListWorkflowsResponse)
     
     async def get_workflow_state(
         self,
@@ -63,28 +137,48 @@ class OrchestratorAPI:
             f"/api/zip/orchestrator/workflows/{workflow_id}/state",
             params=params
         )
-        response.raise_for_status()
-        return WorkflowState(**response.json())
+        return _decode(response, WorkflowState)
     
     async def add_node(self, request: AddNodeRequest) -> AddNodeResponse:
         """Add a node to a workflow."""
         response = await self._client._make_request(
             "POST",
             "/api/zip/orchestrator/nodes",
-            json_data=request.dict(by_alias=True, exclude_none=True)
+            content=_encode(request)
         )
-        response.raise_for_status()
-        return AddNodeResponse(**response.json())
+        return _decode(response, AddNodeResponse)
+    
+    async def add_nodes_bulk(self, requests: List[AddNodeRequest]) -> List[AddNodeResponse]:
+        """Add several nodes in one request.
+        
+        Falls back to concurrent add_node calls when the server has no bulk
+        endpoint (the ZIP server routes nodes/bulk to nodes/[nodeId] and
+        answers 405). Results are returned in request order.
+        """
+        if not requests:
+            return []
+        
+        try:
+            response = await self._client._make_request(
+                "POST",
+                "/api/zip/orchestrator/nodes/bulk",
+                content=to_json({"nodes": requests}, by_alias=True, exclude_none=True)
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code not in (404, 405):
+                raise
+            return list(await asyncio.gather(*(self.add_node(request) for request in requests)))
+        
+        return _decode(response, AddNodesBulkResponse).results
     
     async def update_node(self, node_id: str, request: UpdateNodeRequest) -> UpdateNodeResponse:
         """Update node properties."""
         response = await self._client._make_request(
             "PATCH",
             f"/api/zip/orchestrator/nodes/{node_id}",
-            json_data=request.dict(by_alias=True, exclude_none=True)
+            content=_encode(request)
         )
-        response.raise_for_status()
-        return UpdateNodeResponse(**response.json())
+        return _decode(response, UpdateNodeResponse)
     
     async def delete_node(
         self,
@@ -103,55 +197,49 @@ class OrchestratorAPI:
             f"/api/zip/orchestrator/nodes/{node_id}",
             params=params
         )
-        response.raise_for_status()
-        return DeleteNodeResponse(**response.json())
+        return _decode(response, DeleteNodeResponse)
     
     async def connect_nodes(self, request: ConnectNodesRequest) -> ConnectionResponse:
         """Connect two nodes."""
         response = await self._client._make_request(
             "POST",
             "/api/zip/orchestrator/connections",
-            json_data=request.dict(by_alias=True, exclude_none=True)
+            content=_encode(request)
         )
-        response.raise_for_status()
-        return ConnectionResponse(**response.json())
+        return _decode(response, ConnectionResponse)
     
     async def remove_connection(self, request: RemoveConnectionRequest) -> RemoveConnectionResponse:
         """Remove a connection between nodes."""
         response = await self._client._make_request(
             "DELETE",
             "/api/zip/orchestrator/connections",
-            json_data=request.dict(by_alias=True, exclude_none=True)
+            content=_encode(request)
         )
-        response.raise_for_status()
-        return RemoveConnectionResponse(**response.json())
+        return _decode(response, RemoveConnectionResponse)
     
     async def create_group(self, request: CreateGroupRequest) -> CreateGroupResponse:
         """Create a node group."""
         response = await self._client._make_request(
             "POST",
             "/api/zip/orchestrator/groups",
-            json_data=request.dict(by_alias=True, exclude_none=True)
+            content=_encode(request)
         )
-        response.raise_for_status()
-        return CreateGroupResponse(**response.json())
+        return _decode(response, CreateGroupResponse)
     
     async def update_group(self, request: UpdateGroupRequest) -> UpdateGroupResponse:
         """Update group properties."""
         response = await self._client._make_request(
             "PATCH",
             "/api/zip/orchestrator/groups",
-            json_data=request.dict(by_alias=True, exclude_none=True)
+            content=_encode(request)
         )
-        response.raise_for_status()
-        return UpdateGroupResponse(**response.json())
+        return _decode(response, UpdateGroupResponse)
     
     async def remove_group(self, request: RemoveGroupRequest) -> RemoveGroupResponse:
         """Remove a group."""
         response = await self._client._make_request(
             "DELETE",
             "/api/zip/orchestrator/groups",
-            json_data=request.dict(by_alias=True, exclude_none=True)
+            content=_encode(request)
         )
-        response.raise_for_status()
-        return RemoveGroupResponse(**response.json())
\ No newline at end of file
+        return _decode(response, RemoveGroupResponse)
\ No newline at end of file
@@ -1,25 +1,40 @@
 """Webhook subscription functionality for Zeal Python SDK."""
 
 import asyncio
-import hashlib
+import fnmatch
 import hmac
-import json
+import itertools
+import re
 import signal
 import ssl
 from asyncio import AbstractEventLoop
+from collections import deque
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Set, Union
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
 
-from aiohttp import web, ClientSession
-from aiohttp.web import Request, Response
-from pydantic import BaseModel, Field
+import orjson
 
+from .auth import _hmac_prototype, _sign
+from .config import _DATACLASS_OPTIONS
 from .events import ZipWebhookEvent, parse_zip_webhook_event
+from .types import JsonObject, _AliasModel
 from .webhooks import WebhooksAPI
 
+if TYPE_CHECKING:
+    # aiohttp is only needed once a webhook server is started, so it is
+    # imported lazily to keep `import zeal` cheap
+    from aiohttp import web
+    from aiohttp.web import Request, Response
+    
+    from .types import CreateWebhookRequest
+
+# Largest webhook body accepted, and the chunk size used to stream it in
+MAX_WEBHOOK_BODY_BYTES = 16 * 1024 * 1024
+WEBHOOK_READ_CHUNK_BYTES = 64 * 1024
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SubscriptionOptions:
     """Options for configuring webhook subscriptions."""
     port: int = 3001
@@ -31,29 +46,153 @@ class SubscriptionOptions:
     namespace: str = "default"
     events: List[str] = field(default_factory=lambda: ["*"])
     buffer_size: int = 1000
+    replay_size: int = 0  # Recent events kept for buffered_events(); 0 disables replay
     headers: Optional[Dict[str, str]] = None
     verify_signature: bool = False
     secret_key: Optional[str] = None
+    max_concurrent_deliveries: int = 256
+
+
+def _wire_object(value: Any, name: str) -> Dict[str, Any]:
+    """Check that a decoded webhook value is a JSON object."""
+    if not isinstance(value, dict):
+        raise ValueError(f"Webhook {name} must be an object")
+    return value
 
 
-class WebhookMetadata(BaseModel):
+def _wire_str(data: Dict[str, Any], key: str) -> str:
+    """Get a required string field from a decoded webhook object."""
+    value = data.get(key)
+    if not isinstance(value, str):
+        raise ValueError(f"Webhook field '{key}' must be a string")
+    return value
+
+
+class WebhookMetadata(_AliasModel):
     """Webhook delivery metadata."""
     namespace: str
-    delivery_id: str = Field(alias="deliveryId")
+    delivery_id: str
     timestamp: str
     
-    class Config:
-        populate_by_name = True
+    @classmethod
+    def from_wire(cls, data: Dict[str, Any]) -> "WebhookMetadata":
+        """Build metadata from the wire (camelCase) form without full validation."""
+        data = _wire_object(data, "metadata")
+        return cls.model_construct(
+            namespace=_wire_str(data, "namespace"),
+            delivery_id=_wire_str(data, "deliveryId"),
+            timestamp=_wire_str(data, "timestamp")
+        )
 
 
-class WebhookDelivery(BaseModel):
+class WebhookDelivery(_AliasModel):
     """Webhook delivery containing multiple events."""
-    webhook_id: str = Field(alias="webhookId")
-    events: List[Dict[str, Any]]
+    webhook_id: str
+    events: List[JsonObject]
     metadata: WebhookMetadata
     
-    class Config:
-        populate_by_name = True
+    @classmethod
+    def from_wire(cls, data: Dict[str, Any]) -> "WebhookDelivery":
+        """Build a delivery from a decoded webhook body without full validation.
+        
+        Only the envelope shape is checked; events are validated when parsed.
+        """
+        data = _wire_object(data, "delivery")
+        events = data.get("events")
+        if not isinstance(events, list):
+            raise ValueError("Webhook delivery events must be a list")
+        for event in events:
+            _wire_object(event, "event")
+        return cls.model_construct(
+            webhook_id=_wire_str(data, "webhookId"),
+            events=events,
+            metadata=WebhookMetadata.from_wire(data.get("metadata"))
+        )
+
+
+def _compile_matcher(patterns: Union[str, List[str]]) -> Callable[[str], bool]:
+    """Build a matcher for exact names or glob patterns such as "node.*"."""
+    patterns = patterns if isinstance(patterns, list) else [patterns]
+    if not any(char in pattern for pattern in patterns for char in "*?["):
+        return frozenset(patterns).__contains__
+    
+    # One alternation compiled once, instead of fnmatch per pattern per event
+    regex = re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+    return lambda value: regex.match(value) is not None
+
+
+async def _read_body(
+    request: "Request",
+    on_chunk: Optional[Callable[[bytes], None]] = None
+) -> Union[bytes, bytearray]:
+    """Read a request body, into one pre-sized buffer when its length is known.
+    
+    on_chunk sees each chunk as it arrives, e.g. to hash the body in the same pass.
+    """
+    length = request.content_length
+    if not length:
+        body = await request.read()
+        if on_chunk is not None:
+            on_chunk(body)
+        return body
+    
+    body = bytearray(length)
+    view = memoryview(body)
+    offset = 0
+    async for chunk in request.content.iter_chunked(WEBHOOK_READ_CHUNK_BYTES):
+        end = offset + len(chunk)
+        view[offset:end] = chunk
+        offset = end
+        if on_chunk is not None:
+            on_chunk(chunk)
+    if offset != length:
+        raise ValueError(f"Webhook body ended after {offset} of {length} bytes")
+    return body
+
+
+# Queued-subscriber sentinel: the observable completed after the queued events
+_QUEUE_CLOSED = object()
+
+
+class _Registry:
+    """Items keyed by registration id, with a tuple snapshot for iteration.
+    
+    The snapshot is rebuilt on add/remove, which are rare, so the per-event
+    dispatch loops iterate it directly instead of copying the dict.
+    """
+    
+    __slots__ = ('_items', '_ids', '_snapshot')
+    
+    def __init__(self):
+        self._items: Dict[int, Any] = {}
+        self._ids = itertools.count()
+        self._snapshot: Tuple[Any, ...] = ()
+    
+    def add(self, item: Any) -> int:
+        """Add an item and return its registration id."""
+        item_id = next(self._ids)
+        self._items[item_id] = item
+        self._snapshot = tuple(self._items.values())
+        return item_id
+    
+    def remove(self, item_id: int) -> Optional[Any]:
+        """Remove an item by id, returning it or None if already removed."""
+        item = self._items.pop(item_id, None)
+        if item is not None:
+            self._snapshot = tuple(self._items.values())
+        return item
+    
+    def clear(self):
+        """Remove all items."""
+        self._items.clear()
+        self._snapshot = ()
+    
+    def values(self) -> Tuple[Any, ...]:
+        """Get the current snapshot of items in registration order."""
+        return self._snapshot
+    
+    def __len__(self) -> int:
+        return len(self._items)
 
 
 # Type aliases for callbacks
@@ -68,11 +207,11 @@ AsyncWebhookErrorCallback = Callable[[Exception], Any]  # Can be sync or async
 class WebhookObservable:
     """Observable implementation for webhook events."""
     
-    def __init__(self, buffer_size: int = 1000):
-        self._subscribers: List[Dict[str, Any]] = []
+    def __init__(self, buffer_size: int = 1000, replay_size: int = 0):
+        self._subscribers = _Registry()
         self._buffer_size = buffer_size
-        self._event_queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
-        self._error_queue: asyncio.Queue = asyncio.Queue(maxsize=10)
+        # Optional ring buffer of recent events; the oldest is dropped on overflow
+        self._buffer: Deque[ZipWebhookEvent] = deque(maxlen=replay_size)
         self._completed = False
     
     def subscribe(
@@ -84,17 +223,99 @@ class WebhookObservable:
         """Subscribe to webhook events."""
         subscriber = {
             'next': next_handler,
+            'next_is_async': asyncio.iscoroutinefunction(next_handler),
+            'error': error_handler,
+            'error_is_async': asyncio.iscoroutinefunction(error_handler),
+            'complete': complete_handler,
+            'complete_is_async': asyncio.iscoroutinefunction(complete_handler)
+        }
+        subscriber_id = self._subscribers.add(subscriber)
+        
+        def unsubscribe():
+            self._subscribers.remove(subscriber_id)
+        
+        return unsubscribe
+    
+    def subscribe_queued(
+        self,
+        next_handler: AsyncWebhookEventCallback,
+        error_handler: Optional[AsyncWebhookErrorCallback] = None,
+        complete_handler: Optional[Callable[[], Any]] = None
+    ) -> Callable[[], None]:
+        """Subscribe with a private bounded queue drained by its own task.
+        
+        emit() only enqueues for these subscribers, so a slow handler never
+        holds up the producer or other subscribers. When the queue is full
+        the oldest event is dropped and counted in ``subscriber['dropped']``.
+        Must be called from a running event loop.
+        """
+        subscriber = {
+            'next': next_handler,
+            'next_is_async': asyncio.iscoroutinefunction(next_handler),
             'error': error_handler,
-            'complete': complete_handler
+            'error_is_async': asyncio.iscoroutinefunction(error_handler),
+            'complete': complete_handler,
+            'complete_is_async': asyncio.iscoroutinefunction(complete_handler),
+            'queue': asyncio.Queue(maxsize=self._buffer_size),
+            'dropped': 0
         }
-        self._subscribers.append(subscriber)
+        subscriber['task'] = asyncio.create_task(self._consume(subscriber))
+        subscriber_id = self._subscribers.add(subscriber)
         
         def unsubscribe():
-            if subscriber in self._subscribers:
-                self._subscribers.remove(subscriber)
+            if self._subscribers.remove(subscriber_id) is not None:
+                subscriber['task'].cancel()
         
         return unsubscribe
     
+    @staticmethod
+    def _enqueue(subscriber: Dict[str, Any], item: Any):
+        """Put an item on a queued subscriber's queue, dropping the oldest if full."""
+        queue = subscriber['queue']
+        if queue.full():
+            queue.get_nowait()
+            subscriber['dropped'] += 1
+        queue.put_nowait(item)
+    
+    async def _consume(self, subscriber: Dict[str, Any]):
+        """Deliver queued events to a subscriber until the observable completes."""
+        queue = subscriber['queue']
+        handler = subscriber['next']
+        is_async = subscriber['next_is_async']
+        while True:
+            event = await queue.get()
+            if event is _QUEUE_CLOSED:
+                break
+            try:
+                if is_async:
+                    await handler(event)
+                else:
+                    handler(event)
+            except Exception as e:
+                await self._route_error(subscriber, e)
+        
+        complete_handler = subscriber.get('complete')
+        if complete_handler:
+            try:
+                if subscriber['complete_is_async']:
+                    await complete_handler()
+                else:
+                    complete_handler()
+            except Exception:
+                pass  # Ignore errors in complete handlers
+    
+    def is_observed(self) -> bool:
+        """Check whether emitted events would reach a subscriber or the replay buffer.
+        
+        With the default replay_size of 0 this is true only while something
+        is subscribed, including filtered observables derived from this one.
+        """
+        return not self._completed and bool(self._subscribers or self._buffer.maxlen)
+    
+    def buffered_events(self) -> List[ZipWebhookEvent]:
+        """Get a snapshot of the most recently emitted events, oldest first."""
+        return list(self._buffer)
+    
     def filter(self, predicate: Callable[[ZipWebhookEvent], bool]) -> 'WebhookObservable':
         """Create a filtered observable."""
         filtered = WebhookObservable(self._buffer_size)
@@ -116,35 +337,54 @@ class WebhookObservable:
         if self._completed:
             return
         
-        # Send to subscribers
-        for subscriber in self._subscribers.copy():
+        self._buffer.append(event)
+        
+        # Sync handlers run inline; async handlers run concurrently
+        pending = []
+        coros = []
+        for subscriber in self._subscribers.values():
+            if 'queue' in subscriber:
+                self._enqueue(subscriber, event)
+                continue
             try:
-                handler = subscriber['next']
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(event)
+                if subscriber['next_is_async']:
+                    coros.append(subscriber['next'](event))
+                    pending.append(subscriber)
                 else:
-                    handler(event)
+                    subscriber['next'](event)
             except Exception as e:
-                if subscriber.get('error'):
-                    try:
-                        error_handler = subscriber['error']
-                        if asyncio.iscoroutinefunction(error_handler):
-                            await error_handler(e)
-                        else:
-                            error_handler(e)
-                    except Exception:
-                        pass  # Ignore errors in error handlers
+                await self._route_error(subscriber, e)
+        
+        if coros:
+            results = await asyncio.gather(*coros, return_exceptions=True)
+            for subscriber, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    await self._route_error(subscriber, result)
+    
+    @staticmethod
+    async def _route_error(subscriber: Dict[str, Any], err: Exception):
+        """Pass a handler failure to the subscriber's error handler, if any."""
+        error_handler = subscriber.get('error')
+        if not error_handler:
+            return
+        try:
+            if subscriber['error_is_async']:
+                await error_handler(err)
+            else:
+                error_handler(err)
+        except Exception:
+            pass  # Ignore errors in error handlers
     
     def error(self, err: Exception):
         """Emit an error to all subscribers."""
         if self._completed:
             return
         
-        for subscriber in self._subscribers.copy():
+        for subscriber in self._subscribers.values():
             if subscriber.get('error'):
                 try:
                     error_handler = subscriber['error']
-                    if asyncio.iscoroutinefunction(error_handler):
+                    if subscriber['error_is_async']:
                         asyncio.create_task(error_handler(err))
                     else:
                         error_handler(err)
@@ -157,11 +397,15 @@ class WebhookObservable:
             return
         
         self._completed = True
-        for subscriber in self._subscribers.copy():
+        for subscriber in self._subscribers.values():
+            if 'queue' in subscriber:
+                # Completes after the consumer drains what is already queued
+                self._enqueue(subscriber, _QUEUE_CLOSED)
+                continue
             if subscriber.get('complete'):
                 try:
                     complete_handler = subscriber['complete']
-                    if asyncio.iscoroutinefunction(complete_handler):
+                    if subscriber['complete_is_async']:
                         asyncio.create_task(complete_handler())
                     else:
                         complete_handler()
@@ -177,60 +421,83 @@ class WebhookSubscription:
     def __init__(self, webhooks_api: WebhooksAPI, options: Optional[SubscriptionOptions] = None):
         self.webhooks_api = webhooks_api
         self.options = options or SubscriptionOptions()
-        self._server: Optional[web.Application] = None
-        self._server_runner: Optional[web.AppRunner] = None
-        self._site: Optional[web.TCPSite] = None
+        self._server: Optional["web.Application"] = None
+        self._server_runner: Optional["web.AppRunner"] = None
+        self._site: Optional["web.TCPSite"] = None
         
-        self._event_callbacks: List[AsyncWebhookEventCallback] = []
-        self._delivery_callbacks: List[AsyncWebhookDeliveryCallback] = []
-        self._error_callbacks: List[AsyncWebhookErrorCallback] = []
+        # Registries of (callback, is_async) pairs
+        self._event_callbacks = _Registry()
+        self._delivery_callbacks = _Registry()
+        self._error_callbacks = _Registry()
         
         self._webhook_id: Optional[str] = None
+        self._registration_request: Optional["CreateWebhookRequest"] = None
         self._is_running = False
-        self._observable = WebhookObservable(self.options.buffer_size)
+        self._observable = WebhookObservable(self.options.buffer_size, self.options.replay_size)
+        
+        # Deliveries being processed in the background, bounded for backpressure
+        self._inflight: Set[asyncio.Task] = set()
+        self._delivery_slots = asyncio.Semaphore(self.options.max_concurrent_deliveries)
         
         # Graceful shutdown handling
         self._shutdown_event = asyncio.Event()
-        self._setup_signal_handlers()
+        self._installed_signals: List[signal.Signals] = []
+        self._signal_stop_task: Optional[asyncio.Task] = None
     
     def _setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown."""
-        try:
-            for sig in (signal.SIGTERM, signal.SIGINT):
-                signal.signal(sig, lambda s, f: asyncio.create_task(self.stop()))
-        except (OSError, RuntimeError):
-            # Signal handling might not work in all environments
-            pass
+        """Setup signal handlers for graceful shutdown on the running loop.
+        
+        Signals the application already handles on this loop are left alone.
+        """
+        loop = asyncio.get_running_loop()
+        # asyncio's Unix loops keep their handlers here; other loops have none
+        existing = getattr(loop, "_signal_handlers", {})
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            if sig in existing:
+                continue
+            try:
+                loop.add_signal_handler(sig, self._on_shutdown_signal)
+            except (NotImplementedError, RuntimeError, ValueError):
+                # Not supported on Windows loops or outside the main thread
+                continue
+            self._installed_signals.append(sig)
     
-    def on_event(self, callback: AsyncWebhookEventCallback) -> Callable[[], None]:
-        """Subscribe to webhook events with a callback."""
-        self._event_callbacks.append(callback)
+    def _on_shutdown_signal(self):
+        """Stop the subscription, keeping a reference to the stop task."""
+        if self._signal_stop_task is None or self._signal_stop_task.done():
+            self._signal_stop_task = asyncio.create_task(self.stop())
+    
+    def _remove_signal_handlers(self):
+        """Remove only the handlers installed by _setup_signal_handlers."""
+        loop = asyncio.get_running_loop()
+        for sig in self._installed_signals:
+            try:
+                loop.remove_signal_handler(sig)
+            except (NotImplementedError, RuntimeError, ValueError):
+                pass
+        self._installed_signals.clear()
+    
+    def _register_callback(self, registry: _Registry, callback: Any) -> Callable[[], None]:
+        """Add a callback to a registry and return its unsubscribe function."""
+        # Whether the callback is async is resolved once here, not per event
+        callback_id = registry.add((callback, asyncio.iscoroutinefunction(callback)))
         
         def unsubscribe():
-            if callback in self._event_callbacks:
-                self._event_callbacks.remove(callback)
+            registry.remove(callback_id)
         
         return unsubscribe
     
+    def on_event(self, callback: AsyncWebhookEventCallback) -> Callable[[], None]:
+        """Subscribe to webhook events with a callback."""
+        return self._register_callback(self._event_callbacks, callback)
+    
     def on_delivery(self, callback: AsyncWebhookDeliveryCallback) -> Callable[[], None]:
         """Subscribe to webhook deliveries with a callback."""
-        self._delivery_callbacks.append(callback)
-        
-        def unsubscribe():
-            if callback in self._delivery_callbacks:
-                self._delivery_callbacks.remove(callback)
-        
-        return unsubscribe
+        return self._register_callback(self._delivery_callbacks, callback)
     
     def on_error(self, callback: AsyncWebhookErrorCallback) -> Callable[[], None]:
         """Subscribe to errors with a callback."""
-        self._error_callbacks.append(callback)
-        
-        def unsubscribe():
-            if callback in self._error_callbacks:
-                self._error_callbacks.remove(callback)
-        
-        return unsubscribe
+        return self._register_callback(self._error_callbacks, callback)
     
     def as_observable(self) -> WebhookObservable:
         """Get the observable interface."""
@@ -241,8 +508,10 @@ class WebhookSubscription:
         if self._is_running:
             raise RuntimeError("Webhook subscription is already running")
         
+        from aiohttp import web
+        
         # Create the web application
-        self._server = web.Application()
+        self._server = web.Application(client_max_size=MAX_WEBHOOK_BODY_BYTES)
         self._server.router.add_post(self.options.path, self._webhook_handler)
         
         # Setup and start the server
@@ -262,10 +531,10 @@ class WebhookSubscription:
         print(f"Webhook server listening on {protocol}://{self.options.host}:{self.options.port}{self.options.path}")
         
         self._is_running = True
+        self._setup_signal_handlers()
         
-        # Auto-register webhook if enabled
+        # Auto-register webhook if enabled; the site is listening once start() returns
         if self.options.auto_register:
-            await asyncio.sleep(0.1)  # Small delay to ensure server is ready
             await self.register()
     
     async def stop(self) -> None:
@@ -294,6 +563,11 @@ class WebhookSubscription:
         
         self._server = None
         self._is_running = False
+        self._remove_signal_handlers()
+        
+        # Let deliveries that were already accepted finish
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
         
         # Complete the observable
         self._observable.complete()
@@ -305,23 +579,29 @@ class WebhookSubscription:
         if not self._is_running:
             raise RuntimeError("Webhook server must be running before registration")
         
+        request = self._registration_request
+        if request is None:
+            request = self._registration_request = self._build_registration_request()
+        
+        # Register with Zeal
+        result = await self.webhooks_api.create(request)
+        self._webhook_id = result.subscription.id
+        print(f"Registered webhook {self._webhook_id} at {request.url}")
+    
+    def _build_registration_request(self) -> "CreateWebhookRequest":
+        """Build the registration request from the options, once per subscription."""
+        from .types import CreateWebhookRequest
+        
         # Determine the public URL for the webhook
         protocol = "https" if self.options.https else "http"
         host = "localhost" if self.options.host == "0.0.0.0" else self.options.host
         webhook_url = f"{protocol}://{host}:{self.options.port}{self.options.path}"
         
-        # Register with Zeal
-        from .types import CreateWebhookRequest
-        
-        request = CreateWebhookRequest(
+        return CreateWebhookRequest(
             url=webhook_url,
             events=self.options.events,
             headers=self.options.headers or {}
         )
-        
-        result = await self.webhooks_api.create(request)
-        self._webhook_id = result.subscription.id
-        print(f"Registered webhook {self._webhook_id} at {webhook_url}")
     
     def is_running(self) -> bool:
         """Check if the subscription is running."""
@@ -336,14 +616,17 @@ class WebhookSubscription:
         event_types: Union[str, List[str]],
         callback: AsyncWebhookEventCallback
     ) -> Callable[[], None]:
-        """Subscribe to specific event types."""
-        types_set = set(event_types if isinstance(event_types, list) else [event_types])
+        """Subscribe to specific event types (glob patterns are supported)."""
+        matches = _compile_matcher(event_types)
         
-        async def filtered_callback(event: ZipWebhookEvent):
-            if event.type in types_set:
-                if asyncio.iscoroutinefunction(callback):
+        # Sync callbacks get a sync filter so _dispatch runs them inline
+        if asyncio.iscoroutinefunction(callback):
+            async def filtered_callback(event: ZipWebhookEvent):
+                if matches(event.type):
                     await callback(event)
-                else:
+        else:
+            def filtered_callback(event: ZipWebhookEvent):
+                if matches(event.type):
                     callback(event)
         
         return self.on_event(filtered_callback)
@@ -353,14 +636,18 @@ class WebhookSubscription:
         sources: Union[str, List[str]],
         callback: AsyncWebhookEventCallback
     ) -> Callable[[], None]:
-        """Subscribe to events from specific sources."""
-        sources_set = set(sources if isinstance(sources, list) else [sources])
+        """Subscribe to events from specific sources (glob patterns are supported)."""
+        matches = _compile_matcher(sources)
         
-        async def filtered_callback(event: ZipWebhookEvent):
-            if hasattr(event, 'workflow_id') and event.workflow_id in sources_set:
-                if asyncio.iscoroutinefunction(callback):
+        if asyncio.iscoroutinefunction(callback):
+            async def filtered_callback(event: ZipWebhookEvent):
+                workflow_id = getattr(event, 'workflow_id', None)
+                if workflow_id is not None and matches(workflow_id):
                     await callback(event)
-                else:
+        else:
+            def filtered_callback(event: ZipWebhookEvent):
+                workflow_id = getattr(event, 'workflow_id', None)
+                if workflow_id is not None and matches(workflow_id):
                     callback(event)
         
         return self.on_event(filtered_callback)
@@ -369,77 +656,108 @@ class WebhookSubscription:
         """Create a filtered observable."""
         return self._observable.filter(predicate)
     
-    async def _webhook_handler(self, request: Request) -> Response:
+    async def _webhook_handler(self, request: "Request") -> "Response":
         """Handle incoming webhook requests."""
+        from aiohttp.web import HTTPRequestEntityTooLarge, Response
+        
         try:
             # Read request body
-            body = await request.read()
-            body_text = body.decode('utf-8')
+            if (request.content_length or 0) > MAX_WEBHOOK_BODY_BYTES:
+                return Response(status=413, text="Payload too large")
             
-            # Verify signature if enabled
+            # Verify signature if enabled, hashing chunks while they are read
             if self.options.verify_signature and self.options.secret_key:
-                signature = request.headers.get('X-Zeal-Signature', '')
-                if not self._verify_signature(body, signature):
+                mac = _hmac_prototype(self.options.secret_key).copy()
+                body = await _read_body(request, mac.update)
+                expected_sig = self._parse_signature(request.headers.get('X-Zeal-Signature', ''))
+                if expected_sig is None or not hmac.compare_digest(expected_sig, mac.digest()):
                     await self._emit_error(Exception("Invalid webhook signature"))
                     return Response(status=401, text="Invalid signature")
+            else:
+                body = await _read_body(request)
             
             # Parse the delivery
-            delivery_data = json.loads(body_text)
-            delivery = WebhookDelivery(**delivery_data)
+            delivery_data = orjson.loads(body)
+            delivery = WebhookDelivery.from_wire(delivery_data)
             
-            # Process the delivery in background
-            asyncio.create_task(self._process_delivery(delivery))
+            # Process the delivery in background; waits here when too many are in flight
+            await self._delivery_slots.acquire()
+            task = asyncio.create_task(self._process_delivery(delivery))
+            self._inflight.add(task)
+            task.add_done_callback(self._delivery_done)
             
             return Response(status=200, text="OK")
         
+        except HTTPRequestEntityTooLarge:
+            # A body without Content-Length that grew past client_max_size
+            return Response(status=413, text="Payload too large")
         except Exception as e:
             await self._emit_error(e)
             return Response(status=500, text="Internal server error")
     
+    def _delivery_done(self, task: asyncio.Task):
+        """Release the slot held by a finished background delivery."""
+        self._inflight.discard(task)
+        self._delivery_slots.release()
+    
     async def _process_delivery(self, delivery: WebhookDelivery):
         """Process a webhook delivery."""
         try:
             # Call delivery callbacks
-            for callback in self._delivery_callbacks.copy():
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(delivery)
-                    else:
-                        callback(delivery)
-                except Exception as e:
-                    await self._emit_error(e)
+            await self._dispatch(self._delivery_callbacks, delivery)
             
-            # Process individual events
+            # Skip per-event parsing when nothing would receive the events
+            if not self._event_callbacks and not self._observable.is_observed():
+                return
+            
+            # Process individual events, with per-event lookups hoisted to locals
+            parse = parse_zip_webhook_event
+            emit = self._observable.emit
+            dispatch = self._dispatch
+            event_callbacks = self._event_callbacks
             for event_data in delivery.events:
                 try:
                     # Parse the event
-                    event = parse_zip_webhook_event(event_data)
-                    
+                    event = parse(event_data)
+                except Exception as e:
+                    await self._emit_error(Exception(f"Failed to parse event: {e}"))
+                    continue
+                
+                try:
                     # Emit to observable
-                    await self._observable.emit(event)
+                    await emit(event)
                     
                     # Call event callbacks
-                    for callback in self._event_callbacks.copy():
-                        try:
-                            if asyncio.iscoroutinefunction(callback):
-                                await callback(event)
-                            else:
-                                callback(event)
-                        except Exception as e:
-                            await self._emit_error(e)
-                
+                    await dispatch(event_callbacks, event)
                 except Exception as e:
-                    await self._emit_error(Exception(f"Failed to parse event: {e}"))
+                    await self._emit_error(e)
         
         except Exception as e:
             await self._emit_error(e)
     
+    async def _dispatch(self, callbacks: _Registry, arg: Any):
+        """Call sync callbacks inline and async ones concurrently, reporting failures."""
+        coros = []
+        for callback, is_async in callbacks.values():
+            try:
+                if is_async:
+                    coros.append(callback(arg))
+                else:
+                    callback(arg)
+            except Exception as e:
+                await self._emit_error(e)
+        
+        if coros:
+            for result in await asyncio.gather(*coros, return_exceptions=True):
+                if isinstance(result, Exception):
+                    await self._emit_error(result)
+    
     async def _emit_error(self, error: Exception):
         """Emit an error to all error callbacks and the observable."""
         # Call error callbacks
-        for callback in self._error_callbacks.copy():
+        for callback, is_async in self._error_callbacks.values():
             try:
-                if asyncio.iscoroutinefunction(callback):
+                if is_async:
                     await callback(error)
                 else:
                     callback(error)
@@ -449,27 +767,47 @@ class WebhookSubscription:
         # Emit to observable
         self._observable.error(error)
     
-    def _verify_signature(self, body: bytes, signature: str) -> bool:
+    def _verify_signature(self, body: Union[bytes, bytearray], signature: str) -> bool:
         """Verify webhook signature."""
         if not self.options.secret_key:
             return False
         
-        # Parse the signature (format: "sha256=...")
-        if not signature.startswith("sha256="):
+        expected_sig = self._parse_signature(signature)
+        if expected_sig is None:
             return False
         
-        expected_sig = signature[7:]  # Remove "sha256=" prefix
+        return self._verify_digest(body, expected_sig)
+    
+    @staticmethod
+    def _parse_signature(signature: str) -> Optional[bytes]:
+        """Decode a "sha256=<hex>" signature header into a raw digest."""
+        if not signature.startswith("sha256="):
+            return None
+        
+        try:
+            return bytes.fromhex(signature[7:])  # Remove "sha256=" prefix
+        except ValueError:
+            return None
+    
+    def _verify_digest(self, body: Union[bytes, bytearray], expected_sig: bytes) -> bool:
+        """Verify a raw HMAC-SHA256 digest of the webhook body."""
+        if not self.options.secret_key:
+            return False
         
-        # Calculate HMAC
-        calculated_sig = hmac.new(
-            self.options.secret_key.encode('utf-8'),
-            body,
-            hashlib.sha256
-        ).hexdigest()
+        # Calculate HMAC from the cached keyed state for this secret
+        calculated_sig = _sign(self.options.secret_key, body)
         
-        # Compare signatures
+        # Compare raw digests in constant time
         return hmac.compare_digest(expected_sig, calculated_sig)
     
+    def verify_many(self, bodies: List[bytes], signatures: List[str]) -> List[bool]:
+        """Verify a batch of webhook signatures, e.g. when replaying buffered deliveries."""
+        if len(bodies) != len(signatures):
+            raise ValueError("bodies and signatures must have the same length")
+        
+        verify = self._verify_signature
+        return [verify(body, signature) for body, signature in zip(bodies, signatures)]
+    
     async def __aenter__(self):
         """Async context manager entry."""
         await self.start()
@@ -3,6 +3,7 @@
 from typing import TYPE_CHECKING
 
 from .types import (
+    _decode, _encode,
     RegisterTemplatesRequest, RegisterTemplatesResponse,
     ListTemplatesResponse,
     ListCategoriesResponse,
@@ -29,8 +30,7 @@ class TemplatesAPI:
             "GET",
             "/api/zip/categories"
         )
-        response.raise_for_status()
-        return ListCategoriesResponse(**response.json())
+        return _decode(response, ListCategoriesResponse)
 
     async def register_categories(self, request: RegisterCategoriesRequest) -> RegisterCategoriesResponse:
         """Register new categories and subcategories.
@@ -39,10 +39,9 @@ class TemplatesAPI:
         response = await self._client._make_request(
             "POST",
             "/api/zip/categories",
-            json_data=request.dict(by_alias=True, exclude_none=True)
+            content=_encode(request)
         )
-        response.raise_for_status()
-        return RegisterCategoriesResponse(**response.json())
+        return _decode(response, RegisterCategoriesResponse)
 
     async def upload_bundle(self, request: UploadBundleRequest) -> UploadBundleResponse:
         """Upload a Web Component bundle for custom node rendering.
@@ -51,20 +50,18 @@ class TemplatesAPI:
         response = await self._client._make_request(
             "POST",
             "/api/zip/components",
-            json_data=request.dict(by_alias=True, exclude_none=True)
+            content=_encode(request)
         )
-        response.raise_for_status()
-        return UploadBundleResponse(**response.json())
+        return _decode(response, UploadBundleResponse)
 
     async def register(self, request: RegisterTemplatesRequest) -> RegisterTemplatesResponse:
         """Register node templates."""
         response = await self._client._make_request(
             "POST",
             "/api/zip/templates/register",
-            json_data=request.dict(by_alias=True, exclude_none=True)
+            content=_encode(request)
         )
-        response.raise_for_status()
-        return RegisterTemplatesResponse(**response.json())
+        return _decode(response, RegisterTemplatesResponse)
     
     async def list(self, namespace: str) -> ListTemplatesResponse:
         """List available templates in a namespace."""
@@ -75,8 +72,7 @@ class TemplatesAPI:
             "/api/zip/templates/list",
             params=params
         )
-        response.raise_for_status()
-        return ListTemplatesResponse(**response.json())
+        return _decode(response, ListTemplatesResponse)
     
     async def update(
         self,
@@ -91,10 +87,9 @@ class TemplatesAPI:
             "PATCH",
             "/api/zip/templates/update",
             params=params,
-            json_data=template.dict(by_alias=True, exclude_none=True)
+            content=_encode(template)
         )
-        response.raise_for_status()
-        return UpdateTemplateResponse(**response.json())
+        return _decode(response, UpdateTemplateResponse)
     
     async def delete(self, namespace: str, template_id: str) -> DeleteTemplateResponse:
         """Delete a template."""
@@ -105,5 +100,4 @@ class TemplatesAPI:
             "/api/zip/templates/delete",
             params=params
         )
-        response.raise_for_status()
-        return DeleteTemplateResponse(**response.json())
\ No newline at end of file
+        return _decode(response, DeleteTemplateResponse)
\ No newline at end of file
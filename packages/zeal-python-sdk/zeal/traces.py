@@ -1,19 +1,38 @@
 """Traces API implementation."""
 
-import json
+import asyncio
+import logging
 import time
-from typing import List, Optional, Any, TYPE_CHECKING
+from functools import partial
+from typing import Dict, List, Optional, Set, Any, TYPE_CHECKING
+
+import orjson
+from pydantic_core import to_json
 
 from .types import (
+    _decode, _encode,
     CreateTraceSessionRequest, CreateTraceSessionResponse,
     TraceEvent, SubmitEventsResponse,
     CompleteSessionRequest, CompleteSessionResponse,
-    TraceData,
 )
 
 if TYPE_CHECKING:
     from .client import ZealClient
 
+logger = logging.getLogger(__name__)
+
+# Buffered trace events are sent after this delay, or sooner once a
+# session has this many pending
+TRACE_FLUSH_INTERVAL_S = 0.05
+TRACE_MAX_BATCH = 128
+
+# Per-session cap on buffered events while the server is failing; the
+# oldest are dropped beyond it
+TRACE_MAX_BUFFERED_EVENTS = 10_000
+
+# submit_events batches larger than this are serialized off the event loop
+TRACE_THREADED_ENCODE_MIN_EVENTS = 16
+
 
 class TracesAPI:
     """Traces API for execution tracing."""
@@ -21,6 +40,13 @@ class TracesAPI:
     def __init__(self, client: "ZealClient"):
         self._client = client
         self._session_id: Optional[str] = None
+        
+        # Events from trace_node_execution, coalesced per session. They are
+        # kept as encoded JSON objects since they are only ever sent.
+        self._pending: Dict[str, List[bytes]] = {}
+        self._flush_task: Optional["asyncio.Task[None]"] = None
+        # Sessions whose last submission failed; they are only retried in the background
+        self._failed_sessions: Set[str] = set()
     
     @property
     def current_session_id(self) -> Optional[str]:
@@ -32,27 +58,30 @@ class TracesAPI:
         response = await self._client._make_request(
             "POST",
             "/api/zip/traces/sessions",
-            json_data=request.dict(by_alias=True, exclude_none=True)
+            content=_encode(request)
         )
-        response.raise_for_status()
-        
-        result = CreateTraceSessionResponse(**response.json())
+        result = _decode(response, CreateTraceSessionResponse)
         self._session_id = result.session_id
         return result
     
     async def submit_events(self, session_id: str, events: List[TraceEvent]) -> SubmitEventsResponse:
         """Submit trace events."""
-        request_body = {
-            "events": [event.dict(by_alias=True, exclude_none=True) for event in events]
-        }
-        
+        encode = partial(to_json, {"events": events}, by_alias=True, exclude_none=True)
+        if len(events) > TRACE_THREADED_ENCODE_MIN_EVENTS:
+            # Large batches carry full_data payloads; don't stall the loop on them
+            content = await asyncio.get_running_loop().run_in_executor(None, encode)
+        else:
+            content = encode()
+        return await self._post_events(session_id, content)
+    
+    async def _post_events(self, session_id: str, content: bytes) -> SubmitEventsResponse:
+        """Post an encoded {"events": [...]} body."""
         response = await self._client._make_request(
             "POST",
             f"/api/zip/traces/{session_id}/events",
-            json_data=request_body
+            content=content
         )
-        response.raise_for_status()
-        return SubmitEventsResponse(**response.json())
+        return _decode(response, SubmitEventsResponse)
     
     async def submit_event(self, session_id: str, event: TraceEvent) -> SubmitEventsResponse:
         """Submit a single trace event."""
@@ -64,14 +93,15 @@ class TracesAPI:
         request: CompleteSessionRequest
     ) -> CompleteSessionResponse:
         """Complete a trace session."""
+        # Buffered events must reach the server before the session closes
+        await self.flush()
+        
         response = await self._client._make_request(
             "POST",
             f"/api/zip/traces/{session_id}/complete",
-            json_data=request.dict(by_alias=True, exclude_none=True)
+            content=_encode(request)
         )
-        response.raise_for_status()
-        
-        result = CompleteSessionResponse(**response.json())
+        result = _decode(response, CompleteSessionResponse)
         if self._session_id == session_id:
             self._session_id = None
         
@@ -87,6 +117,10 @@ class TracesAPI:
     ) -> None:
         """Helper method to trace node execution.
         
+        Events are buffered and submitted in batches; call flush() (or
+        complete_session(), or close the client) to make sure they have
+        been sent.
+        
         Args:
             session_id: Trace session ID
             node_id: Node ID being traced
@@ -94,20 +128,81 @@ class TracesAPI:
             data: Event data
             duration_ms: Execution duration in milliseconds
         """
-        data_json = json.dumps(data)
-        trace_data = TraceData(
-            size=len(data_json),
-            data_type="application/json",
-            preview=data,
-            full_data=data
-        )
+        # Encode data once, now, so later changes to it by the caller are not
+        # sent and size always matches the payload
+        encoded = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
         
-        event = TraceEvent(
-            timestamp=int(time.time() * 1000),
-            node_id=node_id,
-            event_type=event_type,
-            data=trace_data,
-            duration=duration_ms
-        )
+        # Same shape TraceEvent serializes to, without building two models per event
+        head: Dict[str, Any] = {
+            "timestamp": int(time.time() * 1000),
+            "nodeId": node_id,
+            "eventType": event_type
+        }
+        if duration_ms is not None:
+            head["duration"] = duration_ms
+        
+        trace_data = b'{"size":%d,"dataType":"application/json"' % len(encoded)
+        if data is not None:
+            trace_data += b',"preview":' + encoded + b',"fullData":' + encoded
+        event = orjson.dumps(head)[:-1] + b',"data":' + trace_data + b'}}'
+        
+        pending = self._pending.setdefault(session_id, [])
+        pending.append(event)
+        if len(pending) > TRACE_MAX_BUFFERED_EVENTS:
+            self._drop_oldest(session_id, pending)
+        
+        if len(pending) >= TRACE_MAX_BATCH and session_id not in self._failed_sessions:
+            await self._flush_session(session_id)
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+    
+    async def flush(self) -> None:
+        """Submit all buffered trace events now.
+        
+        Events whose submission fails stay buffered and the error is raised.
+        """
+        # Let an in-progress background submission finish (or re-buffer) first
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        
+        for session_id in list(self._pending):
+            await self._flush_session(session_id)
+    
+    async def _flush_session(self, session_id: str) -> None:
+        """Submit the buffered events of one session, keeping them if it fails."""
+        batch = self._pending.pop(session_id, None)
+        if not batch:
+            return
         
-        await self.submit_event(session_id, event)
\ No newline at end of file
+        try:
+            await self._post_events(session_id, b'{"events":[' + b",".join(batch) + b"]}")
+        except BaseException:
+            # Put the batch back ahead of anything traced in the meantime
+            self._failed_sessions.add(session_id)
+            pending = batch + self._pending.get(session_id, [])
+            if len(pending) > TRACE_MAX_BUFFERED_EVENTS:
+                self._drop_oldest(session_id, pending)
+            self._pending[session_id] = pending
+            raise
+        self._failed_sessions.discard(session_id)
+    
+    @staticmethod
+    def _drop_oldest(session_id: str, pending: List[bytes]) -> None:
+        """Trim an over-full session buffer, oldest first.
+        
+        At least a batch is dropped at a time, so a long outage logs once per
+        batch rather than once per traced event.
+        """
+        dropped = max(len(pending) - TRACE_MAX_BUFFERED_EVENTS, TRACE_MAX_BATCH)
+        del pending[:dropped]
+        logger.warning("Dropped %d buffered trace events for session %s", dropped, session_id)
+    
+    async def _flush_later(self) -> None:
+        """Background flush after the coalescing interval."""
+        await asyncio.sleep(TRACE_FLUSH_INTERVAL_S)
+        for session_id in list(self._pending):
+            try:
+                await self._flush_session(session_id)
+            except Exception as e:
+                # The events stay buffered for the next flush
+                logger.warning("Failed to submit trace events for session %s: %s", session_id, e)
\ No newline at end of file
@@ -1,60 +1,137 @@
 """Type definitions for Zeal SDK."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar, Union
+from pydantic import BaseModel, ConfigDict, GetCoreSchemaHandler
+from pydantic.alias_generators import to_camel
+from pydantic_core import core_schema
+from typing_extensions import Annotated
 
+if TYPE_CHECKING:
+    import httpx
 
-class Position(BaseModel):
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+class _JsonObjectSchema:
+    """Validate JSON input as a dict, but accept Python dicts without copying.
+    
+    The default dict validator copies every key of a Python dict; payloads
+    that are already decoded (e.g. webhook events) only need a type check
+    and a check that their keys are strings.
+    """
+    
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.json_or_python_schema(
+            json_schema=handler(source),
+            python_schema=core_schema.no_info_after_validator_function(
+                cls._check_keys, core_schema.is_instance_schema(dict)
+            )
+        )
+    
+    @staticmethod
+    def _check_keys(value: Dict[Any, Any]) -> Dict[str, Any]:
+        """Reject top-level keys that are not strings, as Dict[str, Any] would."""
+        for key in value:
+            if not isinstance(key, str):
+                raise ValueError(f"object keys must be strings, got {type(key).__name__}")
+        return value
+
+
+# A free-form JSON object field
+JsonObject = Annotated[Dict[str, Any], _JsonObjectSchema]
+
+
+class _Model(BaseModel):
+    """Base for SDK models; core schemas are built on first use, not at import."""
+    model_config = ConfigDict(defer_build=True)
+
+
+class _AliasModel(_Model):
+    """Base for models whose fields may be set by name or by their camelCase API alias."""
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+
+def _encode(request: BaseModel) -> bytes:
+    """Serialize a request model straight to JSON bytes in pydantic-core.
+    
+    Calls the model's compiled serializer directly, skipping the type
+    inference the generic to_json() does first.
+    """
+    return request.__pydantic_serializer__.to_json(request, by_alias=True, exclude_none=True)
+
+
+def _decode(response: "httpx.Response", model: Type[_ModelT]) -> _ModelT:
+    """Decode a successful response body into model, raising for any other status."""
+    if not response.is_success:
+        response.raise_for_status()
+    return model.model_validate_json(response.content)
+
+
+class Position(_Model):
     """2D position coordinates."""
     x: float
     y: float
 
 
-class NodePort(BaseModel):
+class NodePort(_AliasModel):
     """Node port specification."""
-    node_id: str = Field(alias="nodeId")
-    port_id: str = Field(alias="portId")
+    node_id: str
+    port_id: str
     
-    class Config:
-        populate_by_name = True
+    def to_dict(self) -> Dict[str, str]:
+        """Serialize to the API (aliased) form without pydantic introspection."""
+        return {"nodeId": self.node_id, "portId": self.port_id}
 
 
-class HealthCheckResponse(BaseModel):
+class HealthCheckResponse(_Model):
     """Health check response."""
     status: str
     version: str
     services: Dict[str, str]
 
 
+class SuccessMessageResponse(_Model):
+    """Response carrying only a success flag and a message, shared by the delete/remove endpoints."""
+    success: bool
+    message: str
+
+
 # === Orchestrator Types ===
 
-class CreateWorkflowRequest(BaseModel):
+class CreateWorkflowRequest(_Model):
     """Request to create a new workflow."""
     name: str
     description: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[JsonObject] = None
 
 
-class CreateWorkflowResponse(BaseModel):
+class CreateWorkflowResponse(_AliasModel):
     """Response from creating a workflow."""
-    workflow_id: str = Field(alias="workflowId")
+    workflow_id: str
     name: str
     version: int
-    graph_id: str = Field(alias="graphId")
-    metadata: Optional[Dict[str, Any]] = None
-    
-    class Config:
-        populate_by_name = True
+    graph_id: str
+    metadata: Optional[JsonObject] = None
 
 
-class ListWorkflowsParams(BaseModel):
+class ListWorkflowsParams(_Model):
     """Parameters for listing workflows."""
     limit: Optional[int] = None
     offset: Optional[int] = None
+    
+    def to_query(self) -> Dict[str, int]:
+        """Query parameters for the set fields, without pydantic introspection."""
+        query = {}
+        if self.limit is not None:
+            query["limit"] = self.limit
+        if self.offset is not None:
+            query["offset"] = self.offset
+        return query
 
 
-class ListWorkflowsResponse(BaseModel):
+class ListWorkflowsResponse(_Model):
     """Response from listing workflows."""
     workflows: List[Any]
     total: int
@@ -62,204 +139,158 @@ class ListWorkflowsResponse(BaseModel):
     offset: int
 
 
-class WorkflowState(BaseModel):
+class WorkflowState(_AliasModel):
     """Current state of a workflow."""
-    workflow_id: str = Field(alias="workflowId")
-    graph_id: str = Field(alias="graphId")
+    workflow_id: str
+    graph_id: str
     name: str
     description: str
     version: int
     state: Any
     metadata: Any
-    
-    class Config:
-        populate_by_name = True
 
 
-class AddNodeRequest(BaseModel):
+class AddNodeRequest(_AliasModel):
     """Request to add a node to a workflow."""
-    workflow_id: str = Field(alias="workflowId")
-    graph_id: Optional[str] = Field(default=None, alias="graphId")
-    template_id: str = Field(alias="templateId")
+    workflow_id: str
+    graph_id: Optional[str] = None
+    template_id: str
     position: Position
-    properties: Optional[Dict[str, Any]] = None
-    metadata: Optional[Dict[str, Any]] = None
-    instance_name: Optional[str] = Field(default=None, alias="instanceName")
-    
-    class Config:
-        populate_by_name = True
+    properties: Optional[JsonObject] = None
+    metadata: Optional[JsonObject] = None
+    instance_name: Optional[str] = None
 
 
-class AddNodeResponse(BaseModel):
+class AddNodeResponse(_AliasModel):
     """Response from adding a node."""
-    node_id: str = Field(alias="nodeId")
+    node_id: str
     node: Any
-    
-    class Config:
-        populate_by_name = True
 
 
-class UpdateNodeRequest(BaseModel):
+class AddNodesBulkResponse(_Model):
+    """Response from adding several nodes in one request."""
+    results: List[AddNodeResponse]
+
+
+class UpdateNodeRequest(_AliasModel):
     """Request to update node properties."""
-    workflow_id: str = Field(alias="workflowId")
-    graph_id: Optional[str] = Field(default=None, alias="graphId")
-    properties: Optional[Dict[str, Any]] = None
+    workflow_id: str
+    graph_id: Optional[str] = None
+    properties: Optional[JsonObject] = None
     position: Optional[Position] = None
-    
-    class Config:
-        populate_by_name = True
 
 
-class UpdateNodeResponse(BaseModel):
+class UpdateNodeResponse(_Model):
     """Response from updating a node."""
     success: bool
 
 
-class DeleteNodeResponse(BaseModel):
-    """Response from deleting a node."""
-    success: bool
-    message: str
+DeleteNodeResponse = SuccessMessageResponse
 
 
-class ConnectNodesRequest(BaseModel):
+class ConnectNodesRequest(_AliasModel):
     """Request to connect two nodes."""
-    workflow_id: str = Field(alias="workflowId")
-    graph_id: Optional[str] = Field(default=None, alias="graphId")
+    workflow_id: str
+    graph_id: Optional[str] = None
     source: NodePort
     target: NodePort
-    
-    class Config:
-        populate_by_name = True
 
 
-class ConnectionResponse(BaseModel):
+class ConnectionResponse(_AliasModel):
     """Response from connecting nodes."""
-    connection_id: str = Field(alias="connectionId")
+    connection_id: str
     connection: Any
-    
-    class Config:
-        populate_by_name = True
 
 
-class RemoveConnectionRequest(BaseModel):
+class RemoveConnectionRequest(_AliasModel):
     """Request to remove a connection."""
-    workflow_id: str = Field(alias="workflowId")
-    graph_id: Optional[str] = Field(default=None, alias="graphId")
-    connection_id: str = Field(alias="connectionId")
-    
-    class Config:
-        populate_by_name = True
+    workflow_id: str
+    graph_id: Optional[str] = None
+    connection_id: str
 
 
-class RemoveConnectionResponse(BaseModel):
-    """Response from removing a connection."""
-    success: bool
-    message: str
+RemoveConnectionResponse = SuccessMessageResponse
 
 
-class CreateGroupRequest(BaseModel):
+class CreateGroupRequest(_AliasModel):
     """Request to create a node group."""
-    workflow_id: str = Field(alias="workflowId")
-    graph_id: Optional[str] = Field(default=None, alias="graphId")
+    workflow_id: str
+    graph_id: Optional[str] = None
     title: str
-    node_ids: List[str] = Field(alias="nodeIds")
+    node_ids: List[str]
     color: Optional[str] = None
     description: Optional[str] = None
-    
-    class Config:
-        populate_by_name = True
 
 
-class CreateGroupResponse(BaseModel):
+class CreateGroupResponse(_AliasModel):
     """Response from creating a group."""
     success: bool
-    group_id: str = Field(alias="groupId")
+    group_id: str
     group: Any
-    
-    class Config:
-        populate_by_name = True
 
 
-class UpdateGroupRequest(BaseModel):
+class UpdateGroupRequest(_AliasModel):
     """Request to update group properties."""
-    workflow_id: str = Field(alias="workflowId")
-    graph_id: Optional[str] = Field(default=None, alias="graphId")
-    group_id: str = Field(alias="groupId")
+    workflow_id: str
+    graph_id: Optional[str] = None
+    group_id: str
     title: Optional[str] = None
-    node_ids: Optional[List[str]] = Field(default=None, alias="nodeIds")
+    node_ids: Optional[List[str]] = None
     color: Optional[str] = None
     description: Optional[str] = None
-    
-    class Config:
-        populate_by_name = True
 
 
-class UpdateGroupResponse(BaseModel):
+class UpdateGroupResponse(_Model):
     """Response from updating a group."""
     success: bool
     group: Any
 
 
-class RemoveGroupRequest(BaseModel):
+class RemoveGroupRequest(_AliasModel):
     """Request to remove a group."""
-    workflow_id: str = Field(alias="workflowId")
-    graph_id: Optional[str] = Field(default=None, alias="graphId")
-    group_id: str = Field(alias="groupId")
-    
-    class Config:
-        populate_by_name = True
+    workflow_id: str
+    graph_id: Optional[str] = None
+    group_id: str
 
 
-class RemoveGroupResponse(BaseModel):
-    """Response from removing a group."""
-    success: bool
-    message: str
+RemoveGroupResponse = SuccessMessageResponse
 
 
 # === Template Types ===
 
-class Port(BaseModel):
+class Port(_AliasModel):
     """Node port definition."""
     id: str
     label: str
     type: str
     position: str
-    data_type: Optional[str] = Field(default=None, alias="dataType")
+    data_type: Optional[str] = None
     required: Optional[bool] = None
     multiple: Optional[bool] = None
-    
-    class Config:
-        populate_by_name = True
 
 
-class PropertyValidation(BaseModel):
+class PropertyValidation(_AliasModel):
     """Property validation rules."""
     required: Optional[bool] = None
     min: Optional[float] = None
     max: Optional[float] = None
-    min_length: Optional[int] = Field(default=None, alias="minLength")
-    max_length: Optional[int] = Field(default=None, alias="maxLength")
+    min_length: Optional[int] = None
+    max_length: Optional[int] = None
     pattern: Optional[str] = None
-    custom_rule: Optional[str] = Field(default=None, alias="customRule")
-    
-    class Config:
-        populate_by_name = True
+    custom_rule: Optional[str] = None
 
 
-class PropertyDefinition(BaseModel):
+class PropertyDefinition(_AliasModel):
     """Property definition."""
     type: str
     label: Optional[str] = None
     description: Optional[str] = None
-    default_value: Optional[Any] = Field(default=None, alias="defaultValue")
+    default_value: Optional[Any] = None
     options: Optional[List[Any]] = None
     validation: Optional[PropertyValidation] = None
-    
-    class Config:
-        populate_by_name = True
 
 
-class RuntimeRequirements(BaseModel):
+class RuntimeRequirements(_Model):
     """Runtime requirements for a template."""
     memory: Optional[str] = None
     cpu: Optional[str] = None
@@ -269,44 +300,38 @@ class RuntimeRequirements(BaseModel):
     timeout: Optional[int] = None
 
 
-class DisplayComponent(BaseModel):
+class DisplayComponent(_AliasModel):
     """Web Component display configuration for custom node rendering."""
     element: str
-    bundle_id: Optional[str] = Field(default=None, alias="bundleId")
+    bundle_id: Optional[str] = None
     source: Optional[str] = None
     shadow: Optional[bool] = None
-    observed_props: Optional[List[str]] = Field(default=None, alias="observedProps")
+    observed_props: Optional[List[str]] = None
     width: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
 
-
-class UploadBundleRequest(BaseModel):
+class UploadBundleRequest(_Model):
     """Request to upload a Web Component bundle."""
     namespace: str
     source: str
 
 
-class UploadBundleResponse(BaseModel):
+class UploadBundleResponse(_AliasModel):
     """Response from uploading a bundle."""
-    bundle_id: str = Field(alias="bundleId")
+    bundle_id: str
     namespace: str
     url: str
     size: int
 
-    class Config:
-        populate_by_name = True
-
 
-class SubcategoryDefinition(BaseModel):
+class SubcategoryDefinition(_Model):
     """Subcategory definition."""
     id: str
     label: str
     description: str
 
 
-class CategoryDefinition(BaseModel):
+class CategoryDefinition(_Model):
     """Node template category definition."""
     id: str
     label: str
@@ -315,47 +340,41 @@ class CategoryDefinition(BaseModel):
     subcategories: List[SubcategoryDefinition]
 
 
-class ListCategoriesResponse(BaseModel):
+class ListCategoriesResponse(_Model):
     """Response from listing categories."""
     categories: List[CategoryDefinition]
     count: int
 
 
-class SubcategoryRegistration(BaseModel):
+class SubcategoryRegistration(_AliasModel):
     """Subcategory to register."""
     name: str
-    display_name: str = Field(alias="displayName")
+    display_name: str
     description: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
 
-
-class CategoryRegistration(BaseModel):
+class CategoryRegistration(_AliasModel):
     """Category to register."""
     name: str
-    display_name: str = Field(alias="displayName")
+    display_name: str
     description: Optional[str] = None
     icon: Optional[str] = None
     subcategories: Optional[List[SubcategoryRegistration]] = None
 
-    class Config:
-        populate_by_name = True
-
 
-class RegisterCategoriesRequest(BaseModel):
+class RegisterCategoriesRequest(_Model):
     """Request to register new categories."""
     categories: List[CategoryRegistration]
 
 
-class RegisterCategoriesResponse(BaseModel):
+class RegisterCategoriesResponse(_Model):
     """Response from registering categories."""
     registered: int
     updated: int
-    categories: List[Dict[str, Any]]
+    categories: List[JsonObject]
 
 
-class NodeTemplate(BaseModel):
+class NodeTemplate(_Model):
     """Node template definition."""
     id: str
     type: str
@@ -374,222 +393,184 @@ class NodeTemplate(BaseModel):
     display: Optional[DisplayComponent] = None
 
 
-class RegisterTemplatesRequest(BaseModel):
+class RegisterTemplatesRequest(_Model):
     """Request to register templates."""
     namespace: str
     templates: List[NodeTemplate]
 
 
-class RegisterTemplatesResponse(BaseModel):
+class RegisterTemplatesResponse(_AliasModel):
     """Response from registering templates."""
     success: bool
-    registered_count: int = Field(alias="registeredCount")
-    updated_count: int = Field(alias="updatedCount")
-    registered_ids: List[str] = Field(alias="registeredIds")
-    updated_ids: List[str] = Field(alias="updatedIds")
-    
-    class Config:
-        populate_by_name = True
+    registered_count: int
+    updated_count: int
+    registered_ids: List[str]
+    updated_ids: List[str]
 
 
-class ListTemplatesResponse(BaseModel):
+class ListTemplatesResponse(_Model):
     """Response from listing templates."""
     templates: List[NodeTemplate]
     total: int
 
 
-class UpdateTemplateResponse(BaseModel):
+class UpdateTemplateResponse(_Model):
     """Response from updating a template."""
     success: bool
     template: NodeTemplate
 
 
-class DeleteTemplateResponse(BaseModel):
-    """Response from deleting a template."""
-    success: bool
-    message: str
+DeleteTemplateResponse = SuccessMessageResponse
 
 
 # === Trace Types ===
 
-class CreateTraceSessionRequest(BaseModel):
+class CreateTraceSessionRequest(_AliasModel):
     """Request to create a trace session."""
-    workflow_id: str = Field(alias="workflowId")
-    workflow_version_id: Optional[str] = Field(default=None, alias="workflowVersionId")
-    execution_id: str = Field(alias="executionId")
-    metadata: Optional[Dict[str, Any]] = None
-    
-    class Config:
-        populate_by_name = True
+    workflow_id: str
+    workflow_version_id: Optional[str] = None
+    execution_id: str
+    metadata: Optional[JsonObject] = None
 
 
-class CreateTraceSessionResponse(BaseModel):
+class CreateTraceSessionResponse(_AliasModel):
     """Response from creating a trace session."""
-    session_id: str = Field(alias="sessionId")
-    workflow_id: str = Field(alias="workflowId")
-    execution_id: str = Field(alias="executionId")
-    created_at: datetime = Field(alias="createdAt")
-    
-    class Config:
-        populate_by_name = True
+    session_id: str
+    workflow_id: str
+    execution_id: str
+    created_at: datetime
 
 
-class TraceData(BaseModel):
+class TraceData(_AliasModel):
     """Trace event data."""
     size: int
-    data_type: str = Field(alias="dataType")
+    data_type: str
     preview: Optional[Any] = None
-    full_data: Optional[Any] = Field(default=None, alias="fullData")
-    
-    class Config:
-        populate_by_name = True
+    full_data: Optional[Any] = None
 
 
-class TraceError(BaseModel):
+class TraceError(_Model):
     """Trace error information."""
     message: str
     code: Optional[str] = None
     stack: Optional[str] = None
 
 
-class TraceEvent(BaseModel):
+class TraceEvent(_AliasModel):
     """Trace event."""
     timestamp: int
-    node_id: str = Field(alias="nodeId")
-    port_id: Optional[str] = Field(default=None, alias="portId")
-    event_type: str = Field(alias="eventType")
+    node_id: str
+    port_id: Optional[str] = None
+    event_type: str
     data: TraceData
     duration: Optional[int] = None
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[JsonObject] = None
     error: Optional[TraceError] = None
-    
-    class Config:
-        populate_by_name = True
 
 
-class SubmitEventsResponse(BaseModel):
+class SubmitEventsResponse(_AliasModel):
     """Response from submitting events."""
     success: bool
-    events_processed: int = Field(alias="eventsProcessed")
-    
-    class Config:
-        populate_by_name = True
+    events_processed: int
 
 
-class SessionSummary(BaseModel):
+class SessionSummary(_AliasModel):
     """Session summary statistics."""
-    total_nodes: int = Field(alias="totalNodes")
-    successful_nodes: int = Field(alias="successfulNodes")
-    failed_nodes: int = Field(alias="failedNodes")
-    total_duration: int = Field(alias="totalDuration")
-    total_data_processed: int = Field(alias="totalDataProcessed")
-    
-    class Config:
-        populate_by_name = True
+    total_nodes: int
+    successful_nodes: int
+    failed_nodes: int
+    total_duration: int
+    total_data_processed: int
 
 
-class SessionError(BaseModel):
+class SessionError(_AliasModel):
     """Session error information."""
     message: str
-    node_id: Optional[str] = Field(default=None, alias="nodeId")
+    node_id: Optional[str] = None
     stack: Optional[str] = None
-    
-    class Config:
-        populate_by_name = True
 
 
-class CompleteSessionRequest(BaseModel):
+class CompleteSessionRequest(_Model):
     """Request to complete a session."""
     status: str
     summary: Optional[SessionSummary] = None
     error: Optional[SessionError] = None
 
 
-class CompleteSessionResponse(BaseModel):
+class CompleteSessionResponse(_AliasModel):
     """Response from completing a session."""
     success: bool
-    session_id: str = Field(alias="sessionId")
+    session_id: str
     status: str
-    
-    class Config:
-        populate_by_name = True
 
 
 # === Webhook Types ===
 
-class WebhookSubscription(BaseModel):
+class WebhookSubscription(_AliasModel):
     """Webhook subscription definition."""
     id: str
     url: str
     events: List[str]
     headers: Optional[Dict[str, str]] = None
     secret: Optional[str] = None
-    max_retries: int = Field(alias="maxRetries")
-    retry_interval: int = Field(alias="retryInterval")
-    is_active: bool = Field(alias="isActive")
-    created_at: datetime = Field(alias="createdAt")
-    
-    class Config:
-        populate_by_name = True
+    max_retries: int
+    retry_interval: int
+    is_active: bool
+    created_at: datetime
 
 
-class CreateWebhookRequest(BaseModel):
+class CreateWebhookRequest(_AliasModel):
     """Request to create a webhook."""
     url: str
     events: List[str]
     headers: Optional[Dict[str, str]] = None
     secret: Optional[str] = None
-    max_retries: Optional[int] = Field(default=None, alias="maxRetries")
-    retry_interval: Optional[int] = Field(default=None, alias="retryInterval")
-    
-    class Config:
-        populate_by_name = True
+    max_retries: Optional[int] = None
+    retry_interval: Optional[int] = None
 
 
-class CreateWebhookResponse(BaseModel):
+class CreateWebhookResponse(_Model):
     """Response from creating a webhook."""
     success: bool
     subscription: WebhookSubscription
 
 
-class ListWebhooksResponse(BaseModel):
+class ListWebhooksResponse(_Model):
     """Response from listing webhooks."""
     subscriptions: List[WebhookSubscription]
     total: int
 
 
-class UpdateWebhookRequest(BaseModel):
+class UpdateWebhookRequest(_AliasModel):
     """Request to update a webhook."""
     url: Optional[str] = None
     events: Optional[List[str]] = None
     headers: Optional[Dict[str, str]] = None
     secret: Optional[str] = None
-    max_retries: Optional[int] = Field(default=None, alias="maxRetries")
-    retry_interval: Optional[int] = Field(default=None, alias="retryInterval")
-    is_active: Optional[bool] = Field(default=None, alias="isActive")
-    
-    class Config:
-        populate_by_name = True
+    max_retries: Optional[int] = None
+    retry_interval: Optional[int] = None
+    is_active: Optional[bool] = None
 
 
-class UpdateWebhookResponse(BaseModel):
+class UpdateWebhookResponse(_Model):
     """Response from updating a webhook."""
     success: bool
     subscription: WebhookSubscription
 
 
-class DeleteWebhookResponse(BaseModel):
-    """Response from deleting a webhook."""
-    success: bool
-    message: str
+DeleteWebhookResponse = SuccessMessageResponse
 
 
-class TestWebhookResponse(BaseModel):
+class TestWebhookResponse(_AliasModel):
     """Response from testing a webhook."""
     success: bool
-    status_code: int = Field(alias="statusCode")
-    response_time_ms: int = Field(alias="responseTimeMs")
+    status_code: int
+    response_time_ms: int
     error: Optional[str] = None
-    
-    class Config:
-        populate_by_name = True
\ No newline at end of file
+
+
+def warmup() -> None:
+    """Build every deferred model schema now, e.g. during application startup."""
+    for model in list(globals().values()):
+        if isinstance(model, type) and issubclass(model, _Model) and not model.__pydantic_complete__:
+            model.model_rebuild()
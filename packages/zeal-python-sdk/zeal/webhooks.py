@@ -3,6 +3,7 @@
 from typing import TYPE_CHECKING
 
 from .types import (
+    _decode, _encode,
     CreateWebhookRequest, CreateWebhookResponse,
     ListWebhooksResponse,
     UpdateWebhookRequest, UpdateWebhookResponse,
@@ -25,35 +26,30 @@ class WebhooksAPI:
         response = await self._client._make_request(
             "POST",
             "/api/zip/webhooks",
-            json_data=request.dict(by_alias=True, exclude_none=True)
+            content=_encode(request)
         )
-        response.raise_for_status()
-        return CreateWebhookResponse(**response.json())
+        return _decode(response, CreateWebhookResponse)
     
     async def list(self) -> ListWebhooksResponse:
         """List webhook subscriptions."""
         response = await self._client._make_request("GET", "/api/zip/webhooks")
-        response.raise_for_status()
-        return ListWebhooksResponse(**response.json())
+        return _decode(response, ListWebhooksResponse)
     
     async def update(self, webhook_id: str, request: UpdateWebhookRequest) -> UpdateWebhookResponse:
         """Update a webhook subscription."""
         response = await self._client._make_request(
             "PATCH",
             f"/api/zip/webhooks/{webhook_id}",
-            json_data=request.dict(by_alias=True, exclude_none=True)
+            content=_encode(request)
         )
-        response.raise_for_status()
-        return UpdateWebhookResponse(**response.json())
+        return _decode(response, UpdateWebhookResponse)
     
     async def delete(self, webhook_id: str) -> DeleteWebhookResponse:
         """Delete a webhook subscription."""
         response = await self._client._make_request("DELETE", f"/api/zip/webhooks/{webhook_id}")
-        response.raise_for_status()
-        return DeleteWebhookResponse(**response.json())
+        return _decode(response, DeleteWebhookResponse)
     
     async def test(self, webhook_id: str) -> TestWebhookResponse:
         """Test a webhook subscription."""
         response = await self._client._make_request("POST", f"/api/zip/webhooks/{webhook_id}/test")
-        response.raise_for_status()
-        return TestWebhookResponse(**response.json())
\ No newline at end of file
+        return _decode(response, TestWebhookResponse)
\ No newline at end of file